@@ -0,0 +1,69 @@
+"""
+Compares two result files written by run.py and exits with status 1 if
+any measurement got slower, or used more memory, by more than the
+threshold.
+
+    python benchmarks/compare.py baseline.json candidate.json --threshold 0.1
+"""
+import argparse
+import json
+import sys
+
+
+def _key(result):
+    return result["graph"], result["num_vertices"], result["backend"], result["algorithm"]
+
+
+def load(path):
+    with open(path) as results_file:
+        return {_key(result): result for result in json.load(results_file)["results"]}
+
+
+def compare(baseline, candidate, threshold, min_seconds=0.001):
+    """
+    :param threshold: relative increase, 0.1 for 10%, above which a change
+                      is a regression
+    :param min_seconds: timings below this are too noisy to compare
+    :return: list of (key, metric, baseline value, candidate value) regressions
+             and list of lines describing every shared measurement
+    """
+    regressions = []
+    lines = []
+
+    for key in sorted(set(baseline) & set(candidate)):
+        old, new = baseline[key], candidate[key]
+        time_ratio = new["seconds"] / old["seconds"] if old["seconds"] > 0 else 1.0
+        memory_ratio = new["peak_bytes"] / old["peak_bytes"] if old["peak_bytes"] > 0 else 1.0
+
+        flags = []
+        if time_ratio > 1 + threshold and old["seconds"] >= min_seconds:
+            regressions.append((key, "seconds", old["seconds"], new["seconds"]))
+            flags.append("SLOWER")
+        if memory_ratio > 1 + threshold:
+            regressions.append((key, "peak_bytes", old["peak_bytes"], new["peak_bytes"]))
+            flags.append("MORE MEMORY")
+
+        lines.append("%-12s %8d %-7s %-42s time x%.2f  memory x%.2f %s" % (key + (time_ratio, memory_ratio,
+                                                                               " ".join(flags))))
+
+    return regressions, lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("baseline", help="results of the reference revision")
+    parser.add_argument("candidate", help="results of the revision being checked")
+    parser.add_argument("--threshold", type=float, default=0.1, help="allowed relative increase")
+    args = parser.parse_args(argv)
+
+    regressions, lines = compare(load(args.baseline), load(args.candidate), args.threshold)
+
+    for line in lines:
+        print(line)
+
+    print("%d regressions" % len(regressions))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""
+Seeded synthetic graph generators for the benchmarks. Every generator
+returns the number of vertices and the src, dst and weights arrays of the
+edges, which build_graph loads into any backend.
+"""
+import numpy as np
+
+
+def erdos_renyi(num_vertices, average_degree=10, seed=0):
+    """
+    :return: a G(n, m) random graph with n * average_degree / 2 edges between
+             uniformly chosen vertices
+    """
+    rng = np.random.default_rng(seed)
+    num_edges = num_vertices * average_degree // 2
+
+    src = rng.integers(0, num_vertices, num_edges)
+    dst = rng.integers(0, num_vertices, num_edges)
+
+    return num_vertices, src, dst, rng.integers(1, 100, num_edges).astype(np.float64)
+
+
+def grid(num_vertices, seed=0):
+    """
+    :return: a road-like square grid with about num_vertices vertices, every
+             vertex joined to its horizontal and vertical neighbours
+    """
+    rng = np.random.default_rng(seed)
+    side = max(int(np.sqrt(num_vertices)), 2)
+    vertex_ids = np.arange(side * side).reshape(side, side)
+
+    src = np.concatenate((vertex_ids[:, :-1].ravel(), vertex_ids[:-1, :].ravel()))
+    dst = np.concatenate((vertex_ids[:, 1:].ravel(), vertex_ids[1:, :].ravel()))
+
+    return side * side, src, dst, rng.integers(1, 10, len(src)).astype(np.float64)
+
+
+def power_law(num_vertices, average_degree=10, exponent=2.5, seed=0):
+    """
+    :return: a Chung-Lu random graph whose expected degrees follow a power law
+             with the given exponent, so a few hub vertices have most edges
+    """
+    rng = np.random.default_rng(seed)
+    num_edges = num_vertices * average_degree // 2
+
+    expected_degree = np.arange(1, num_vertices + 1) ** (-1.0 / (exponent - 1))
+    probabilities = expected_degree / expected_degree.sum()
+
+    src = rng.choice(num_vertices, num_edges, p=probabilities)
+    dst = rng.choice(num_vertices, num_edges, p=probabilities)
+
+    return num_vertices, src, dst, rng.integers(1, 100, num_edges).astype(np.float64)
+
+
+def random_dag(num_vertices, average_degree=5, seed=0):
+    """
+    :return: a random directed acyclic graph, every edge leads from a lower
+             to a higher position in a random order of the vertices
+    """
+    rng = np.random.default_rng(seed)
+    num_edges = num_vertices * average_degree
+
+    first = rng.integers(0, num_vertices, num_edges)
+    second = rng.integers(0, num_vertices, num_edges)
+
+    order = rng.permutation(num_vertices)
+    src = order[np.minimum(first, second)]
+    dst = order[np.maximum(first, second)]
+
+    return num_vertices, src, dst, rng.integers(1, 100, num_edges).astype(np.float64)
+
+
+def build_graph(graph_class, edges, directed):
+    """
+    :param graph_class: Graph backend to build
+    :param edges: tuple returned by a generator
+    :param directed: True to build a directed graph
+    :return: the graph holding the edges, leaving out self loops which an
+             adjacency set cannot hold
+    """
+    num_vertices, src, dst, weights = edges
+    keep = src != dst
+
+    graph = graph_class(num_vertices, directed=directed)
+    graph.add_edges(src[keep], dst[keep], weights[keep])
+
+    return graph
+
+
+GENERATORS = {
+    "erdos_renyi": (erdos_renyi, False),
+    "grid": (grid, False),
+    "power_law": (power_law, False),
+    "dag": (random_dag, True),
+}
@@ -0,0 +1,77 @@
+"""
+Compares the number of vertices settled by the point to point shortest
+path queries in graph_algorithms.dijkstra on a road-like grid graph.
+
+Run from the repository root:
+
+    python benchmarks/point_to_point.py [side] [num_queries]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from generators import grid
+from graph_algorithms.dijkstra import (LandmarkHeuristic, astar, bidirectional_dijkstra, euclidean_heuristic,
+                                       single_source_dijkstra)
+from graph_algorithms.graph import CSRGraph
+
+
+def grid_graph(side, seed=0):
+    """
+    :return: a side x side grid graph, whose edge weights are at least the
+             distance between the vertices, and the coordinates of every vertex
+    """
+    num_vertices, src, dst, weights = grid(side * side, seed)
+
+    graph = CSRGraph(num_vertices, directed=False)
+    graph.add_edges(src, dst, weights)
+
+    vertex_ids = np.arange(num_vertices)
+    coordinates = np.column_stack((vertex_ids // side, vertex_ids % side))
+
+    return graph, coordinates
+
+
+def run(side=100, num_queries=20, seed=0):
+    graph, coordinates = grid_graph(side, seed)
+    rng = np.random.default_rng(seed)
+    queries = rng.integers(0, graph.num_vertices, size=(num_queries, 2)).tolist()
+
+    corners = [0, side - 1, side * (side - 1), side * side - 1]
+    landmarks = LandmarkHeuristic(graph, corners)
+
+    searches = [
+        ("full dijkstra", lambda s, t: single_source_dijkstra(graph, s)),
+        ("early exit dijkstra", lambda s, t: single_source_dijkstra(graph, s, t)),
+        ("bidirectional dijkstra", lambda s, t: bidirectional_dijkstra(graph, s, t)),
+        ("a* euclidean", lambda s, t: astar(graph, s, t, euclidean_heuristic(coordinates, t))),
+        ("a* landmarks", lambda s, t: astar(graph, s, t, landmarks.heuristic(t))),
+    ]
+
+    print("%d vertices, %d queries" % (graph.num_vertices, num_queries))
+    print("%-24s %16s %12s" % ("search", "settled / query", "ms / query"))
+
+    baseline = None
+    for name, search in searches:
+        num_settled = 0
+        start = time.perf_counter()
+
+        for source, destination in queries:
+            num_settled += search(source, destination).num_settled
+
+        elapsed = (time.perf_counter() - start) / num_queries
+        num_settled /= num_queries
+
+        if baseline is None:
+            baseline = num_settled
+
+        print("%-24s %16.0f %12.2f   (%.1fx fewer settled)" % (name, num_settled, elapsed * 1000,
+                                                              baseline / num_settled))
+
+
+if __name__ == "__main__":
+    run(*[int(arg) for arg in sys.argv[1:]])
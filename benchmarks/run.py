@@ -0,0 +1,214 @@
+"""
+Times every algorithm on every graph backend over seeded synthetic graphs
+and writes the results as JSON, which compare.py checks between revisions.
+
+Run from the repository root:
+
+    python benchmarks/run.py --sizes 1000 10000 --output results.json
+"""
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from generators import GENERATORS, build_graph
+from graph_algorithms import (boruvka, components, dijkstra, floyd_warshall, kruskal, prim, priority_dict,
+                              shortest_path, topological_sort, traversal)
+from graph_algorithms.graph import AdjacencyMatrixGraph, AdjacencySetGraph, CSRGraph
+
+BACKENDS = {
+    "matrix": AdjacencyMatrixGraph,
+    "set": AdjacencySetGraph,
+    "csr": CSRGraph,
+}
+
+# the dense matrix needs V^2 memory, so it is only built for small graphs
+MAX_MATRIX_VERTICES = 2000
+
+
+def _consume(iterator):
+    for _ in iterator:
+        pass
+
+
+# name, function of the graph, whether it needs a DAG and the largest graph
+# it runs on, None for no limit
+ALGORITHMS = [
+    ("dijkstra.build_distance_table", lambda g: dijkstra.build_distance_table(g, 0), False, None),
+    ("dijkstra.build_distance_table[heap]",
+     lambda g: dijkstra.build_distance_table(g, 0, max_bucket_weight=None), False, None),
+    ("dijkstra.single_source_dijkstra", lambda g: dijkstra.single_source_dijkstra(g, 0), False, None),
+    ("dijkstra.bidirectional_dijkstra", lambda g: dijkstra.bidirectional_dijkstra(g, 0, g.num_vertices - 1), False, None),
+    ("shortest_path.build_dist_table", lambda g: shortest_path.build_dist_table(g, 0), False, None),
+    ("shortest_path.frontier_bfs", lambda g: shortest_path.frontier_bfs(g, 0), False, None),
+    ("traversal.iter_breadth_first", lambda g: _consume(traversal.iter_breadth_first(g, 0)), False, None),
+    ("traversal.iter_depth_first", lambda g: _consume(traversal.iter_depth_first(g, 0)), False, None),
+    ("prim.minimum_spanning_tree", lambda g: prim.minimum_spanning_tree(g, 0), False, None),
+    ("kruskal.minimum_spanning_forest", kruskal.minimum_spanning_forest, False, None),
+    ("boruvka.minimum_spanning_forest", boruvka.minimum_spanning_forest, False, None),
+    ("components.connected_components", components.connected_components, False, None),
+    ("components.strongly_connected_components", components.strongly_connected_components, False, None),
+    ("floyd_warshall.floyd_warshall", floyd_warshall.floyd_warshall, False, 500),
+    ("topological_sort.topological_sort", topological_sort.topological_sort, True, None),
+    ("topological_sort.topological_layers", topological_sort.topological_layers, True, None),
+    ("topological_sort.critical_path", topological_sort.critical_path, True, None),
+]
+
+QUEUES = {
+    "priority_dict.priority_dict": priority_dict.priority_dict,
+    "priority_dict.indexed_priority_dict": priority_dict.indexed_priority_dict,
+}
+
+
+def measure(function, repeats):
+    """
+    :return: the fastest of the timed runs in seconds and the peak memory
+             allocated by a separate traced run in bytes
+    """
+    timings = []
+
+    # some algorithms print their results, which is not what is measured
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeats):
+            start = time.perf_counter()
+            function()
+            timings.append(time.perf_counter() - start)
+
+        tracemalloc.start()
+        try:
+            function()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return min(timings), peak
+
+
+def queue_workload(queue_class, size, seed):
+    """
+    :return: function pushing size random priorities, lowering a quarter of
+             them and popping everything
+    """
+    rng = np.random.default_rng(seed)
+    priorities = rng.random(size).tolist()
+    lowered = rng.integers(0, size, size // 4).tolist()
+
+    def workload():
+        queue = queue_class()
+        for key, priority in enumerate(priorities):
+            queue[key] = priority
+        for key in lowered:
+            if key in queue:
+                queue[key] = queue[key] / 2
+        while queue:
+            queue.pop_smallest()
+
+    return workload
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                              universal_newlines=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(sizes, repeats=3, seed=0, generators=None, backends=None, log=print):
+    """
+    :return: list of result records, one per (graph, size, backend, algorithm)
+    """
+    results = []
+
+    def record(graph_name, num_vertices, num_edges, backend, algorithm, function):
+        seconds, peak_bytes = measure(function, repeats)
+        results.append({
+            "graph": graph_name,
+            "num_vertices": num_vertices,
+            "num_edges": num_edges,
+            "backend": backend,
+            "algorithm": algorithm,
+            "seconds": seconds,
+            "peak_bytes": peak_bytes,
+        })
+        log("%-12s %8d %-7s %-42s %10.4fs %12d B" % (graph_name, num_vertices, backend, algorithm,
+                                                     seconds, peak_bytes))
+
+    for size in sizes:
+        for name, queue_class in QUEUES.items():
+            record("queue", size, 0, "-", name, queue_workload(queue_class, size, seed))
+
+        for graph_name, (generator, directed) in GENERATORS.items():
+            if generators and graph_name not in generators:
+                continue
+
+            edges = generator(size, seed=seed)
+            num_vertices, num_edges = edges[0], len(edges[1])
+
+            for backend, graph_class in BACKENDS.items():
+                if backends and backend not in backends:
+                    continue
+                if graph_class is AdjacencyMatrixGraph and num_vertices > MAX_MATRIX_VERTICES:
+                    continue
+
+                record(graph_name, num_vertices, num_edges, backend, "build",
+                       lambda: build_graph(graph_class, edges, directed))
+
+                graph = build_graph(graph_class, edges, directed)
+
+                for algorithm, function, needs_dag, max_vertices in ALGORITHMS:
+                    if needs_dag != directed:
+                        continue
+                    if max_vertices is not None and num_vertices > max_vertices:
+                        continue
+
+                    record(graph_name, num_vertices, num_edges, backend, algorithm,
+                           lambda: function(graph))
+
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000],
+                        help="number of vertices of the generated graphs")
+    parser.add_argument("--repeats", type=int, default=3, help="timed runs per measurement")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the graph generators")
+    parser.add_argument("--graphs", nargs="+", choices=sorted(GENERATORS), help="generators to run")
+    parser.add_argument("--backends", nargs="+", choices=sorted(BACKENDS), help="backends to run")
+    parser.add_argument("--output", default="bench_results.json", help="path of the JSON results")
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.repeats, args.seed, args.graphs, args.backends)
+
+    report = {
+        "meta": {
+            "revision": git_revision(),
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "sizes": args.sizes,
+            "repeats": args.repeats,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+
+    with open(args.output, "w") as output:
+        json.dump(report, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Graph representations and the algorithms which run on them.
+
+Submodules are imported lazily on first access, so importing the package
+is cheap and loads neither NumPy nor any algorithm that is not used::
+
+    import graph_algorithms
+
+    g = graph_algorithms.CSRGraph(4)
+    graph_algorithms.dijkstra.single_source_dijkstra(g, 0)
+
+Every submodule also runs a small demo when executed directly, see
+``python -m graph_algorithms --help``.
+"""
+import importlib
+
+SUBMODULES = (
+    "bellman_ford",
+    "boruvka",
+    "components",
+    "dijkstra",
+    "disjoint_set",
+    "dynamic_shortest_path",
+    "dynamic_topological_sort",
+    "floyd_warshall",
+    "graph",
+    "graph_io",
+    "instrumentation",
+    "kruskal",
+    "multi_source",
+    "path_cache",
+    "prim",
+    "priority_dict",
+    "shortest_path",
+    "topological_sort",
+    "traversal",
+)
+
+# names which can be imported from the package itself and the submodule
+# defining each of them
+_LAZY_ATTRIBUTES = {
+    "Graph": "graph",
+    "AdjacencyMatrixGraph": "graph",
+    "AdjacencySetGraph": "graph",
+    "CSRGraph": "graph",
+    "DisjointSet": "disjoint_set",
+    "DynamicShortestPaths": "dynamic_shortest_path",
+    "DynamicTopologicalOrder": "dynamic_topological_sort",
+    "ShortestPathResult": "dijkstra",
+    "ShortestPathCache": "path_cache",
+}
+
+__all__ = list(SUBMODULES) + list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    if name in SUBMODULES:
+        value = importlib.import_module("." + name, __name__)
+    elif name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module("." + _LAZY_ATTRIBUTES[name], __name__), name)
+    else:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+    # later lookups find the attribute without calling __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
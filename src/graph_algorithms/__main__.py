@@ -0,0 +1,18 @@
+import argparse
+import runpy
+
+from . import SUBMODULES
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m graph_algorithms",
+                                     description="Runs the demo of a graph algorithm")
+    parser.add_argument("demo", choices=sorted(set(SUBMODULES) - {"disjoint_set", "priority_dict"}),
+                        help="module whose demo to run")
+
+    args = parser.parse_args(argv)
+    runpy.run_module("graph_algorithms." + args.demo, run_name="__main__", alter_sys=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+import numpy as np
+from .dijkstra import ShortestPathResult, single_source_dijkstra
+from .graph import AdjacencyMatrixGraph, CSRGraph
+
+
+def _arc_arrays(graph):
+    """
+    :return: the src, dst and weights arrays of every edge in the graph, an
+             undirected edge appears once in each direction
+    """
+    src, dst, weights = graph.edges()
+
+    return src.astype(np.int64), dst.astype(np.int64), weights
+
+
+def _relax_edges(src, dst, weights, distances, predecessors):
+    """
+    Relaxes every edge in rounds until no distance improves. Each round
+    relaxes all the edges at once against the distances of the previous
+    round, so after round i every shortest path of up to i edges is known.
+
+    :param distances: array of the initial distances, updated in place
+    :param predecessors: array of the initial predecessors, updated in place
+    """
+    num_vertices = len(distances)
+
+    for round_number in range(num_vertices):
+        candidates = distances[src] + weights
+        improved = np.flatnonzero(candidates < distances[dst])
+
+        # no distance changed, so none will change in later rounds either
+        if len(improved) == 0:
+            return
+
+        # a shortest path has at most V - 1 edges, a path still improving
+        # after that many rounds goes around a negative weight cycle
+        if round_number == num_vertices - 1:
+            raise ValueError("The graph has a negative weight cycle")
+
+        improved_dst = dst[improved]
+        improved_candidates = candidates[improved]
+
+        np.minimum.at(distances, improved_dst, improved_candidates)
+
+        # the predecessor is the start of an edge giving the new distance
+        best = improved[improved_candidates == distances[improved_dst]]
+        predecessors[dst[best]] = src[best]
+
+
+def bellman_ford(graph, source):
+    """
+    Bellman-Ford single source shortest paths, which allows negative edge
+    weights. Every round is a single pass of array operations over all the
+    edges, and the search stops as soon as a round changes nothing.
+
+    Raises ValueError if a negative weight cycle is reachable from the
+    source. An undirected edge with a negative weight is such a cycle.
+
+    :param graph: graph to search
+    :param source: vertex the search starts from
+    :return: ShortestPathResult of the search, the number of settled vertices
+             is the number of vertices reached
+    """
+    src, dst, weights = _arc_arrays(graph)
+
+    distances = np.full(graph.num_vertices, np.inf)
+    predecessors = np.full(graph.num_vertices, -1, dtype=np.int64)
+
+    distances[source] = 0
+    predecessors[source] = source
+
+    _relax_edges(src, dst, weights, distances, predecessors)
+
+    return ShortestPathResult(source, distances, predecessors, int(np.count_nonzero(predecessors >= 0)))
+
+
+def johnson(graph, sources=None):
+    """
+    Johnson's all pairs shortest paths for sparse graphs with negative
+    edge weights.
+
+    Bellman-Ford from a virtual vertex joined to every vertex by an edge of
+    weight 0 gives every vertex a potential h. Reweighting every edge (u, v)
+    to w + h(u) - h(v) makes all the weights non-negative without changing
+    which paths are shortest, so Dijkstra's algorithm can then run from
+    every source on the reweighted graph.
+
+    :param graph: graph without negative weight cycles
+    :param sources: sequence of vertices to find the distances from, every
+                    vertex if None
+    :return: array holding the distances from every source in a row, and
+             array holding the predecessors of every vertex on the paths from
+             every source in a row
+    """
+    if sources is None:
+        sources = range(graph.num_vertices)
+
+    csr_graph = graph.to_csr()
+    src, dst, weights = _arc_arrays(csr_graph)
+
+    # the virtual vertex reaches every vertex with a distance of 0
+    potentials = np.zeros(graph.num_vertices)
+    _relax_edges(src, dst, weights, potentials, np.zeros(graph.num_vertices, dtype=np.int64))
+
+    # rounding may leave a tiny negative weight on an edge of a shortest path
+    reweighted = np.maximum(weights + potentials[src] - potentials[dst], 0)
+    reweighted_graph = CSRGraph.from_arrays(csr_graph.indptr, csr_graph.indices, reweighted,
+                                            directed=csr_graph.directed)
+
+    distances = np.empty((len(sources), graph.num_vertices))
+    predecessors = np.empty((len(sources), graph.num_vertices), dtype=np.int64)
+
+    for row, source in enumerate(sources):
+        result = single_source_dijkstra(reweighted_graph, source)
+
+        distances[row] = result.distances - potentials[source] + potentials
+        predecessors[row] = result.predecessors
+
+    return distances, predecessors
+
+
+if __name__ == "__main__":
+
+    # this is a directed graph with some negative weights
+    g = AdjacencyMatrixGraph(6, directed=True, signed_weights=True)
+
+    g.add_edge(0, 1, 4)
+    g.add_edge(0, 2, 2)
+    g.add_edge(2, 1, -1)
+    g.add_edge(1, 3, 2)
+    g.add_edge(3, 4, -2.5)
+    g.add_edge(2, 4, 3)
+    g.add_edge(4, 5, 1)
+
+    result = bellman_ford(g, 0)
+    print("Distances: ", result.distances)
+    print("Shortest Path is: ", result.path_to(5))
+
+    distance_matrix, _ = johnson(g)
+    print(distance_matrix)
+
+    g.add_edge(4, 2, -1)
+
+    try:
+        bellman_ford(g, 0)
+    except ValueError as error:
+        print(error)
@@ -0,0 +1,210 @@
+import concurrent.futures
+import os
+import shutil
+import tempfile
+import numpy as np
+from .disjoint_set import DisjointSet
+from .kruskal import sorted_edges, split_forest
+from .graph import AdjacencyMatrixGraph
+
+# the id used where a component has no edge leaving it
+NO_EDGE = np.iinfo(np.int64).max
+
+# the edge arrays, the ids of the edges still able to join two components
+# and the component of every vertex, memory mapped in every worker process
+# from files shared by all the workers on the host, so that none of them
+# is pickled into a worker or sent with a task
+_worker_src = None
+_worker_dst = None
+_worker_edge_ids = None
+_worker_labels = None
+
+
+def _init_worker(directory):
+    global _worker_src, _worker_dst, _worker_edge_ids, _worker_labels
+    _worker_src = np.load(os.path.join(directory, "src.npy"), mmap_mode="r")
+    _worker_dst = np.load(os.path.join(directory, "dst.npy"), mmap_mode="r")
+    _worker_edge_ids = np.load(os.path.join(directory, "edge_ids.npy"), mmap_mode="r+")
+    _worker_labels = np.load(os.path.join(directory, "labels.npy"), mmap_mode="r")
+
+
+def cheapest_edges(labels, src, dst, edge_ids):
+    """
+    Finds the cheapest edge leaving every component.
+
+    Edges are identified by their position in the edges sorted by weight,
+    so the cheapest edge is the one with the lowest id. Ties in weight are
+    therefore always broken the same way, which keeps the chosen edges
+    free of cycles.
+
+    :param labels: array holding the component of every vertex
+    :param src: array of the start vertex of every edge
+    :param dst: array of the end vertex of every edge
+    :param edge_ids: array of the id of every edge
+    :return: array holding the id of the cheapest edge leaving every
+             component, NO_EDGE where there is none
+    """
+    src_labels = labels[src]
+    dst_labels = labels[dst]
+
+    # edges within a component cannot join it to another one
+    crossing = src_labels != dst_labels
+    crossing_ids = edge_ids[crossing]
+
+    cheapest = np.full(len(labels), NO_EDGE, dtype=np.int64)
+    np.minimum.at(cheapest, src_labels[crossing], crossing_ids)
+    np.minimum.at(cheapest, dst_labels[crossing], crossing_ids)
+
+    return cheapest
+
+
+def _cheapest_edges_task(start, count):
+    """
+    Scans the edges of a chunk which could still join two components. The
+    edges now within a component can never be picked again, so the chunk
+    is compacted in place to the edges which still cross.
+
+    :param start: position of the chunk in the shared edge ids
+    :param count: number of edge ids left in the chunk
+    :return: array of the components with an edge of the chunk leaving them,
+             array of the id of the cheapest such edge of each, and the
+             number of edge ids kept in the chunk
+    """
+    edge_ids = np.array(_worker_edge_ids[start:start + count])
+
+    src_labels = _worker_labels[_worker_src[edge_ids]]
+    dst_labels = _worker_labels[_worker_dst[edge_ids]]
+
+    crossing = src_labels != dst_labels
+    kept = edge_ids[crossing]
+    _worker_edge_ids[start:start + len(kept)] = kept
+
+    # only the components this chunk touches are returned, rather than an
+    # array over every vertex, and the ids are sorted so the first id of
+    # every component is its cheapest edge
+    components = np.concatenate((src_labels[crossing], dst_labels[crossing]))
+    ids = np.concatenate((kept, kept))
+
+    order = np.lexsort((ids, components))
+    components, ids = components[order], ids[order]
+
+    first = np.ones(len(components), dtype=bool)
+    first[1:] = components[1:] != components[:-1]
+
+    return components[first], ids[first], len(kept)
+
+
+def minimum_spanning_forest(graph, processes=None, chunk_size=1000000):
+    """
+    Borůvka's algorithm. Every round each component picks the cheapest edge
+    leaving it and all of those edges are added at once, which at least
+    halves the number of components, so there are at most log V rounds.
+
+    Finding the cheapest edges is a vectorised pass over the edge arrays.
+    With more than one process the arrays are split into chunks which are
+    scanned in parallel and the results combined. The workers map the edges
+    and the labels from temporary files rather than being sent them, and
+    drop the edges within a component from their chunks as they go.
+
+    :param graph: graph which need not be connected
+    :param processes: number of worker processes, the work is done in this
+                      process if None or 1
+    :param chunk_size: number of edges scanned by a worker in one task
+    :return: list holding the minimum spanning tree of every connected
+             component, as described in kruskal.split_forest
+    """
+    edge_src, edge_dst, _ = sorted_edges(graph)
+    num_edges = len(edge_src)
+
+    forest = DisjointSet(graph.num_vertices)
+    labels = forest.labels()
+
+    spanning_forest = []
+
+    executor = None
+    directory = None
+
+    if processes is not None and processes > 1:
+        directory = tempfile.mkdtemp()
+
+        np.save(os.path.join(directory, "src.npy"), edge_src)
+        np.save(os.path.join(directory, "dst.npy"), edge_dst)
+        np.save(os.path.join(directory, "edge_ids.npy"), np.arange(num_edges, dtype=np.int64))
+
+        # the workers map the same pages, so they see the labels written here
+        shared_labels = np.lib.format.open_memmap(os.path.join(directory, "labels.npy"), mode="w+",
+                                                  dtype=labels.dtype, shape=labels.shape)
+
+        # the start of every chunk of edge ids and the number still in it
+        chunk_starts = list(range(0, num_edges, chunk_size))
+        chunk_counts = [min(chunk_size, num_edges - start) for start in chunk_starts]
+
+        executor = concurrent.futures.ProcessPoolExecutor(processes, initializer=_init_worker,
+                                                          initargs=(directory,))
+
+    try:
+        src, dst = edge_src, edge_dst
+        edge_ids = np.arange(num_edges, dtype=np.int64)
+
+        while True:
+            if executor is None:
+                cheapest = cheapest_edges(labels, src, dst, edge_ids)
+            else:
+                shared_labels[:] = labels
+
+                chunks = [chunk for chunk in range(len(chunk_starts)) if chunk_counts[chunk] > 0]
+                tasks = [executor.submit(_cheapest_edges_task, chunk_starts[chunk], chunk_counts[chunk])
+                         for chunk in chunks]
+
+                cheapest = np.full(graph.num_vertices, NO_EDGE, dtype=np.int64)
+                for chunk, task in zip(chunks, tasks):
+                    components, ids, chunk_counts[chunk] = task.result()
+                    np.minimum.at(cheapest, components, ids)
+
+            chosen = np.unique(cheapest[cheapest < num_edges])
+
+            # no component has an edge leaving it
+            if len(chosen) == 0:
+                break
+
+            for edge_id in chosen.tolist():
+                v1, v2 = int(edge_src[edge_id]), int(edge_dst[edge_id])
+
+                # two components may have picked the same edge
+                if forest.union(v1, v2):
+                    spanning_forest.append((v1, v2))
+
+            labels = forest.labels()
+
+            # the edges within a component are dropped as they can never be
+            # picked again, the workers drop them from their chunks themselves
+            if executor is None:
+                crossing = labels[src] != labels[dst]
+                src, dst, edge_ids = src[crossing], dst[crossing], edge_ids[crossing]
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        if directory is not None:
+            del shared_labels
+            shutil.rmtree(directory, ignore_errors=True)
+
+    spanning_forest = np.array(spanning_forest, dtype=np.int64).reshape(-1, 2)
+
+    return split_forest(spanning_forest, labels)
+
+
+if __name__ == "__main__":
+
+    # this undirected graph has three connected components
+    h = AdjacencyMatrixGraph(8, directed=False)
+
+    h.add_edge(0, 1, 1)
+    h.add_edge(1, 2, 2)
+    h.add_edge(2, 0, 3)
+    h.add_edge(3, 4, 1)
+    h.add_edge(4, 5, 2)
+    h.add_edge(6, 7, 1)
+
+    print("Minimum Spanning Forest")
+    for tree in minimum_spanning_forest(h, processes=2, chunk_size=2):
+        print([(int(v1), int(v2)) for v1, v2 in tree])
@@ -0,0 +1,141 @@
+import numpy as np
+from .graph import AdjacencySetGraph
+
+
+def connected_components(graph):
+    """
+    Labels the weakly connected components of the graph, the components
+    found when the direction of every edge is ignored.
+
+    Every vertex starts with its own id as a label. Each round hooks the
+    larger label at the ends of every edge onto the smaller one with array
+    operations over all the edges, then flattens the resulting label trees
+    by pointer jumping, until the two ends of every edge agree.
+
+    :param graph: graph on any backend
+    :return: int32 array of the component of every vertex, components are
+             numbered from 0 in order of their lowest vertex
+    """
+    src, dst, _ = graph.edges()
+    src, dst = src.astype(np.int64), dst.astype(np.int64)
+
+    labels = np.arange(graph.num_vertices, dtype=np.int64)
+
+    while True:
+        src_labels = labels[src]
+        dst_labels = labels[dst]
+
+        differ = src_labels != dst_labels
+        if not differ.any():
+            break
+
+        # the label of a vertex never grows, so every label points at a
+        # vertex with a label at most as large and the trees stay acyclic
+        np.minimum.at(labels, np.maximum(src_labels, dst_labels)[differ],
+                      np.minimum(src_labels, dst_labels)[differ])
+
+        while True:
+            grandparent = labels[labels]
+            if np.array_equal(grandparent, labels):
+                break
+            labels = grandparent
+
+        # drop the edges already inside a single component
+        src, dst = src[differ], dst[differ]
+
+    _, component = np.unique(labels, return_inverse=True)
+    return component.astype(np.int32)
+
+
+def strongly_connected_components(graph):
+    """
+    Labels the strongly connected components of the graph with Tarjan's
+    algorithm. The depth first search keeps its own stack of (vertex, next
+    edge) pairs rather than recursing, so it is not limited by the
+    recursion limit.
+
+    :param graph: graph on any backend
+    :return: int32 array of the component of every vertex, components are
+             numbered in reverse topological order, so an edge between two
+             components always leads to a lower number
+    """
+    csr_graph = graph.to_csr()
+
+    indptr = csr_graph.indptr.tolist()
+    indices = csr_graph.indices.tolist()
+
+    # the order in which every vertex was reached and the earliest reached
+    # vertex on the stack that it can get back to
+    index = [-1] * graph.num_vertices
+    low = [0] * graph.num_vertices
+    on_stack = bytearray(graph.num_vertices)
+
+    labels = np.full(graph.num_vertices, -1, dtype=np.int32)
+    stack = []
+    next_index = 0
+    num_components = 0
+
+    for root in range(graph.num_vertices):
+        if index[root] != -1:
+            continue
+
+        index[root] = low[root] = next_index
+        next_index += 1
+        stack.append(root)
+        on_stack[root] = 1
+
+        search = [(root, indptr[root])]
+
+        while search:
+            vertex, edge = search[-1]
+
+            if edge < indptr[vertex + 1]:
+                search[-1] = (vertex, edge + 1)
+                neighbour = indices[edge]
+
+                if index[neighbour] == -1:
+                    index[neighbour] = low[neighbour] = next_index
+                    next_index += 1
+                    stack.append(neighbour)
+                    on_stack[neighbour] = 1
+                    search.append((neighbour, indptr[neighbour]))
+
+                elif on_stack[neighbour]:
+                    low[vertex] = min(low[vertex], index[neighbour])
+                continue
+
+            # every edge of the vertex has been followed
+            search.pop()
+            if search:
+                parent = search[-1][0]
+                low[parent] = min(low[parent], low[vertex])
+
+            # the vertex is the first reached vertex of its component, which
+            # is everything above it on the stack
+            if low[vertex] == index[vertex]:
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = 0
+                    labels[member] = num_components
+                    if member == vertex:
+                        break
+                num_components += 1
+
+    return labels
+
+
+if __name__ == "__main__":
+
+    # this is a directed graph with three strongly connected components
+    g = AdjacencySetGraph(7, directed=True)
+
+    g.add_edge(0, 1)
+    g.add_edge(1, 2)
+    g.add_edge(2, 0)
+    g.add_edge(2, 3)
+    g.add_edge(3, 4)
+    g.add_edge(4, 3)
+    g.add_edge(5, 6)
+
+    print("Connected components: ", connected_components(g))
+    print("Strongly connected components: ", strongly_connected_components(g))
@@ -0,0 +1,620 @@
+import heapq
+import weakref
+import numpy as np
+from . import instrumentation
+from . import priority_dict as pq
+from .graph import AdjacencyMatrixGraph
+
+
+def _non_negative_csr(graph):
+    """
+    :return: the CSRGraph of the graph
+    """
+    csr_graph = graph.to_csr()
+
+    # only a graph allowing signed weights can hold a negative weight
+    if csr_graph.signed_weights and len(csr_graph.weights) > 0 and csr_graph.weights.min() < 0:
+        raise ValueError("Dijkstra's algorithm cannot handle negative edge weights")
+
+    return csr_graph
+
+
+# the largest edge weight for which build_distance_table uses a bucket
+# queue, above it the buckets scanned while empty outweigh the saved heap work
+DIAL_MAX_WEIGHT = 100
+
+
+# graph -> (version, largest integer weight), so the weights are checked
+# once per version of the graph rather than on every search
+_max_weight_cache = weakref.WeakKeyDictionary()
+
+
+def _max_integer_weight(graph):
+    """
+    :return: the largest edge weight if every weight is a non-negative
+             integer, None otherwise
+    """
+    cached = _max_weight_cache.get(graph)
+    if cached is not None and cached[0] == graph.version:
+        return cached[1]
+
+    _, _, weights = graph.edges()
+
+    if len(weights) == 0:
+        max_weight = 0
+    elif weights.min() < 0 or not np.array_equal(weights, np.floor(weights)):
+        max_weight = None
+    else:
+        max_weight = int(weights.max())
+
+    _max_weight_cache[graph] = (graph.version, max_weight)
+
+    return max_weight
+
+
+@instrumentation.timed("dijkstra.dial")
+def dial_distance_table(graph, source, max_weight=None):
+    """
+    Dial's algorithm, Dijkstra's algorithm with a bucket queue in place of
+    the heap for graphs whose edge weights are small integers.
+
+    A vertex at distance d waits in bucket d modulo max_weight + 1. Every
+    tentative distance lies within max_weight of the distance being
+    settled, so the buckets never hold two distances at once, and the
+    buckets are scanned in a circle. Queueing a vertex is an append and a
+    vertex whose distance has since dropped is skipped when its old entry
+    is reached, so an edge costs O(1) and the whole search O(E + D) for the
+    largest distance D.
+
+    :param graph: graph whose edge weights are non-negative integers
+    :param source: vertex the search starts from
+    :param max_weight: largest edge weight, found from the graph if omitted
+    :return: the distance table in the format of build_distance_table
+    """
+    if max_weight is None:
+        max_weight = _max_integer_weight(graph)
+
+        if max_weight is None:
+            raise ValueError("Dial's algorithm needs non-negative integer edge weights")
+
+    distance_table = {}
+
+    for v_id in range(graph.num_vertices):
+        distance_table[v_id] = (None, None)
+
+    distance_table[source] = (0, source)
+
+    num_buckets = max_weight + 1
+    buckets = [[] for _ in range(num_buckets)]
+    buckets[0].append(source)
+
+    # the number of entries in the buckets, including ones gone stale
+    num_queued = 1
+    current_dist = 0
+
+    counters = instrumentation.active_counters
+    if counters is not None:
+        counters.heap_pushes += 1
+
+    while num_queued > 0:
+        bucket = buckets[current_dist % num_buckets]
+
+        while bucket:
+            current_vertex = bucket.pop()
+            num_queued -= 1
+
+            # an entry whose vertex has since moved to a nearer bucket is stale
+            if distance_table[current_vertex][0] != current_dist:
+                if counters is not None:
+                    counters.heap_pops += 1
+                    counters.stale_skips += 1
+                continue
+
+            neighbours, weights = graph.neighbors_with_weights(current_vertex)
+
+            if counters is not None:
+                counters.heap_pops += 1
+                counters.vertices_settled += 1
+                counters.edges_relaxed += len(neighbours)
+
+            for neighbour, weight in zip(neighbours.tolist(), weights.tolist()):
+                distance = current_dist + weight
+
+                neighbour_distance = distance_table[neighbour][0]
+
+                if neighbour_distance is None or neighbour_distance > distance:
+                    distance_table[neighbour] = (distance, current_vertex)
+
+                    buckets[int(distance) % num_buckets].append(neighbour)
+                    num_queued += 1
+
+                    if counters is not None:
+                        counters.heap_pushes += 1
+
+        current_dist += 1
+
+    return distance_table
+
+
+@instrumentation.timed("dijkstra.build_distance_table")
+def build_distance_table(graph, source, arity=4, max_bucket_weight=DIAL_MAX_WEIGHT):
+    """
+    :param arity: number of children of every node of the heap
+    :param max_bucket_weight: the search uses Dial's bucket queue rather than
+                              the heap when every edge weight is an integer
+                              up to this value, None to always use the heap
+    """
+    if graph.signed_weights:
+        _non_negative_csr(graph)
+
+    if max_bucket_weight is not None:
+        with instrumentation.phase("dijkstra.check_weights"):
+            max_weight = _max_integer_weight(graph)
+
+        if max_weight is not None and max_weight <= max_bucket_weight:
+            return dial_distance_table(graph, source, max_weight)
+
+    # A dictionary mapping the vertex ID to a tuple
+    # of (distance from source, last vertex on path from source)
+    distance_table = {}
+
+    for v_id in range(graph.num_vertices):
+        distance_table[v_id] = (None, None)
+
+    # The distance from the source to itself is 0
+    distance_table[source] = (0, source)
+
+    # Holds the mapping of vertex ID to distance from source vertex
+    # Access the highest priority (lowest distance) item first. The heap
+    # moves an entry when its distance drops instead of keeping stale copies
+    priority_queue = pq.indexed_priority_dict(arity=arity)
+
+    priority_queue[source] = 0
+
+    counters = instrumentation.active_counters
+
+    while len(priority_queue.keys()) > 0:
+
+        current_vertex = priority_queue.pop_smallest()
+
+        # distance of the closest vertex from the source
+        current_dist = distance_table[current_vertex][0]
+
+        # every edge leaving the vertex is read at once rather than a call
+        # to get_edge_weight for every neighbour
+        neighbours, weights = graph.neighbors_with_weights(current_vertex)
+
+        if counters is not None:
+            counters.vertices_settled += 1
+            counters.edges_relaxed += len(neighbours)
+
+        for neighbour, weight in zip(neighbours.tolist(), weights.tolist()):
+            distance = current_dist + weight
+
+            # The last recorded distance to this neighbour from the source
+            neighbour_distance = distance_table[neighbour][0]
+
+            # If there is a currently recorded distance from the source and this
+            # is greater than the distance of the new path found, update the current
+            # distance of the neighbour from the source in the distance table
+            if neighbour_distance is None or neighbour_distance > distance:
+                distance_table[neighbour] = (distance, current_vertex)
+
+                # also update the priority queue entry
+                priority_queue[neighbour] = distance
+
+    return distance_table
+
+
+class ShortestPathResult:
+    """
+    The distances and predecessors found by a single source shortest path
+    search, held in arrays indexed by vertex ID. A vertex which was not
+    reached has an infinite distance and a predecessor of -1.
+
+    A search which stopped early also keeps the mask of the vertices it
+    settled. The arrays of every other vertex only hold tentative values,
+    so asking for its distance or path raises ValueError.
+    """
+    def __init__(self, source, distances, predecessors, num_settled, settled=None):
+        """
+        :param source: vertex the search started from
+        :param distances: array of the distance of every vertex from the source
+        :param predecessors: array of the last vertex on the path to every vertex
+        :param num_settled: number of vertices whose distance was finalised
+        :param settled: boolean array marking the vertices whose distance is
+                        final, None if the search finished and every value is final
+        """
+        self.source = source
+        self.distances = distances
+        self.predecessors = predecessors
+        self.num_settled = num_settled
+        self.settled = settled
+
+    def is_final(self, vertex):
+        """
+        :return: True if the distance and path to the vertex are known
+        """
+        return self.settled is None or bool(self.settled[vertex])
+
+    def _check_final(self, vertex):
+        if not self.is_final(vertex):
+            raise ValueError("The distance to vertex %d is unknown, the search stopped before settling it" % vertex)
+
+    def distance_to(self, destination):
+        self._check_final(destination)
+        return self.distances[destination]
+
+    def path_to(self, destination):
+        """
+        :param destination: vertex at the end of the path
+        :return: list of vertices from the source to the destination, None if
+                 the destination was not reached
+        """
+        self._check_final(destination)
+
+        if self.predecessors[destination] == -1:
+            return None
+
+        # walk back from the destination and reverse once, which takes time
+        # proportional to the length of the path
+        path = [destination]
+
+        while destination != self.source:
+            destination = int(self.predecessors[destination])
+            path.append(destination)
+
+        path.reverse()
+        return path
+
+    def distance_table(self):
+        """
+        :return: the result in the format returned by build_distance_table,
+                 a vertex whose distance is unknown maps to (None, None) just
+                 as an unreached one does
+        """
+        distance_table = {}
+
+        for v_id in range(len(self.distances)):
+            if self.predecessors[v_id] == -1 or not self.is_final(v_id):
+                distance_table[v_id] = (None, None)
+            else:
+                distance_table[v_id] = (self.distances[v_id], int(self.predecessors[v_id]))
+
+        return distance_table
+
+
+@instrumentation.timed("dijkstra.single_source_dijkstra")
+def single_source_dijkstra(graph, source, destination=None):
+    """
+    Dijkstra's algorithm over the CSR arrays of the graph, keeping the
+    distances and predecessors in preallocated arrays rather than dicts.
+
+    :param graph: graph with non-negative edge weights
+    :param source: vertex the search starts from
+    :param destination: if given, the search stops as soon as the distance
+                        to this vertex is final, and the result only knows
+                        the distances of the vertices settled before it
+    :return: ShortestPathResult of the search
+    """
+    with instrumentation.phase("dijkstra.to_csr"):
+        csr_graph = _non_negative_csr(graph)
+        indptr, indices, weights = csr_graph.indptr, csr_graph.indices, csr_graph.weights
+
+    distances = np.full(graph.num_vertices, np.inf)
+    predecessors = np.full(graph.num_vertices, -1, dtype=np.int64)
+    settled = np.zeros(graph.num_vertices, dtype=bool)
+    num_settled = 0
+
+    distances[source] = 0
+    predecessors[source] = source
+
+    # entries whose distance has since improved are skipped when popped
+    heap = [(0.0, source)]
+    num_stale = 0
+    stopped_early = False
+
+    while heap:
+        current_dist, current_vertex = heapq.heappop(heap)
+
+        if settled[current_vertex]:
+            num_stale += 1
+            continue
+
+        settled[current_vertex] = True
+        num_settled += 1
+
+        if current_vertex == destination:
+            stopped_early = True
+            break
+
+        start, end = indptr[current_vertex], indptr[current_vertex + 1]
+
+        for neighbour, weight in zip(indices[start:end].tolist(), weights[start:end].tolist()):
+            distance = current_dist + weight
+
+            if distance < distances[neighbour]:
+                distances[neighbour] = distance
+                predecessors[neighbour] = current_vertex
+                heapq.heappush(heap, (distance, neighbour))
+
+    # the counts follow from the search, so the loop itself is not slowed
+    counters = instrumentation.active_counters
+    if counters is not None:
+        degrees = np.diff(indptr)
+        edges_relaxed = int(degrees[settled].sum())
+        if destination is not None and settled[destination]:
+            edges_relaxed -= int(degrees[destination])
+
+        counters.heap_pops += num_settled + num_stale
+        counters.heap_pushes += num_settled + num_stale + len(heap)
+        counters.stale_skips += num_stale
+        counters.vertices_settled += num_settled
+        counters.edges_relaxed += edges_relaxed
+
+    # a search which ran until the heap was empty settled every vertex it
+    # reached, one stopped at the destination only knows the settled
+    # vertices even if nothing was left on the heap
+    return ShortestPathResult(source, distances, predecessors, num_settled, settled if stopped_early else None)
+
+
+class PathQueryResult:
+    """
+    The answer to a point to point shortest path query
+    """
+    def __init__(self, distance, path, num_settled):
+        """
+        :param distance: length of the shortest path, infinite if there is none
+        :param path: list of vertices from the source to the destination,
+                     None if there is no path
+        :param num_settled: number of vertices whose distance was finalised
+        """
+        self.distance = distance
+        self.path = path
+        self.num_settled = num_settled
+
+
+def bidirectional_dijkstra(graph, source, destination):
+    """
+    Runs Dijkstra's algorithm forwards from the source and backwards from
+    the destination at the same time, always advancing the search with
+    the closer frontier. The searches stop once the two frontiers together
+    cannot improve on the best path found where they meet, which settles
+    roughly two small balls rather than one ball reaching the destination.
+
+    :param graph: graph with non-negative edge weights
+    :param source: vertex the path starts from
+    :param destination: vertex the path ends at
+    :return: PathQueryResult of the query
+    """
+    if source == destination:
+        return PathQueryResult(0.0, [source], 1)
+
+    forward_graph = _non_negative_csr(graph)
+    backward_graph = forward_graph.reverse()
+
+    # index 0 holds the forward search and index 1 the backward search
+    arrays = [(forward_graph.indptr, forward_graph.indices, forward_graph.weights),
+              (backward_graph.indptr, backward_graph.indices, backward_graph.weights)]
+    distances = [np.full(graph.num_vertices, np.inf), np.full(graph.num_vertices, np.inf)]
+    predecessors = [np.full(graph.num_vertices, -1, dtype=np.int64), np.full(graph.num_vertices, -1, dtype=np.int64)]
+    settled = [np.zeros(graph.num_vertices, dtype=bool), np.zeros(graph.num_vertices, dtype=bool)]
+    heaps = [[(0.0, source)], [(0.0, destination)]]
+
+    for side, start_vertex in enumerate((source, destination)):
+        distances[side][start_vertex] = 0
+        predecessors[side][start_vertex] = start_vertex
+
+    best_distance = np.inf
+    meeting_vertex = -1
+    num_settled = 0
+
+    while heaps[0] and heaps[1]:
+
+        # no path through the unsettled vertices can be shorter than this
+        if heaps[0][0][0] + heaps[1][0][0] >= best_distance:
+            break
+
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        other = 1 - side
+
+        current_dist, current_vertex = heapq.heappop(heaps[side])
+
+        if settled[side][current_vertex]:
+            continue
+
+        settled[side][current_vertex] = True
+        num_settled += 1
+
+        indptr, indices, weights = arrays[side]
+        start, end = indptr[current_vertex], indptr[current_vertex + 1]
+
+        for neighbour, weight in zip(indices[start:end].tolist(), weights[start:end].tolist()):
+            distance = current_dist + weight
+
+            if distance < distances[side][neighbour]:
+                distances[side][neighbour] = distance
+                predecessors[side][neighbour] = current_vertex
+                heapq.heappush(heaps[side], (distance, neighbour))
+
+            # the neighbour has been reached by the other search as well
+            through_distance = distances[side][neighbour] + distances[other][neighbour]
+            if through_distance < best_distance:
+                best_distance = through_distance
+                meeting_vertex = neighbour
+
+    if meeting_vertex == -1:
+        return PathQueryResult(np.inf, None, num_settled)
+
+    # the forward search leads from the meeting vertex back to the source and
+    # the backward search leads from the meeting vertex on to the destination
+    path = [meeting_vertex]
+    while path[-1] != source:
+        path.append(int(predecessors[0][path[-1]]))
+    path.reverse()
+
+    while path[-1] != destination:
+        path.append(int(predecessors[1][path[-1]]))
+
+    return PathQueryResult(best_distance, path, num_settled)
+
+
+def astar(graph, source, destination, heuristic=None):
+    """
+    A* search, Dijkstra's algorithm with the vertices ordered by their
+    distance from the source plus an estimate of their distance to the
+    destination. With a consistent heuristic, one which never overestimates
+    and obeys the triangle inequality, the path found is a shortest path.
+
+    :param graph: graph with non-negative edge weights
+    :param source: vertex the path starts from
+    :param destination: vertex the path ends at
+    :param heuristic: function of a vertex returning a lower bound of its
+                      distance to the destination, such as one made by
+                      euclidean_heuristic or LandmarkHeuristic
+    :return: PathQueryResult of the query
+    """
+    csr_graph = _non_negative_csr(graph)
+    indptr, indices, weights = csr_graph.indptr, csr_graph.indices, csr_graph.weights
+
+    if heuristic is None:
+        heuristic = lambda v: 0.0
+
+    distances = np.full(graph.num_vertices, np.inf)
+    predecessors = np.full(graph.num_vertices, -1, dtype=np.int64)
+    settled = np.zeros(graph.num_vertices, dtype=bool)
+    num_settled = 0
+
+    distances[source] = 0
+    predecessors[source] = source
+
+    heap = [(heuristic(source), source)]
+
+    while heap:
+        _, current_vertex = heapq.heappop(heap)
+
+        if settled[current_vertex]:
+            continue
+
+        settled[current_vertex] = True
+        num_settled += 1
+
+        if current_vertex == destination:
+            result = ShortestPathResult(source, distances, predecessors, num_settled, settled)
+            return PathQueryResult(distances[destination], result.path_to(destination), num_settled)
+
+        current_dist = distances[current_vertex]
+        start, end = indptr[current_vertex], indptr[current_vertex + 1]
+
+        for neighbour, weight in zip(indices[start:end].tolist(), weights[start:end].tolist()):
+            distance = current_dist + weight
+
+            if distance < distances[neighbour]:
+                distances[neighbour] = distance
+                predecessors[neighbour] = current_vertex
+                heapq.heappush(heap, (distance + heuristic(neighbour), neighbour))
+
+    return PathQueryResult(np.inf, None, num_settled)
+
+
+def euclidean_heuristic(coordinates, destination):
+    """
+    :param coordinates: array with the position of every vertex in a row, the
+                        weight of every edge must be at least the distance
+                        between the positions of its vertices
+    :param destination: vertex at the end of the path
+    :return: A* heuristic giving the straight line distance to the destination
+    """
+    coordinates = np.asarray(coordinates, dtype=np.float64)
+    target = coordinates[destination]
+
+    def heuristic(v):
+        return float(np.sqrt(np.sum((coordinates[v] - target) ** 2)))
+
+    return heuristic
+
+
+class LandmarkHeuristic:
+    """
+    Lower bounds for A* from precomputed distances to and from a few
+    landmark vertices (the ALT technique). By the triangle inequality,
+    for any landmark L the distance from v to t is at least
+    d(L, t) - d(L, v) and at least d(v, L) - d(t, L).
+
+    Landmarks far apart on the edge of the graph give the tightest bounds.
+    """
+    def __init__(self, graph, landmarks):
+        """
+        :param graph: graph the queries will run on
+        :param landmarks: list of landmark vertices
+        """
+        csr_graph = _non_negative_csr(graph)
+        reverse_graph = csr_graph.reverse()
+
+        self.landmarks = list(landmarks)
+
+        # row i holds the distances from and to landmark i
+        self.from_landmark = np.array([single_source_dijkstra(csr_graph, l).distances for l in self.landmarks])
+        self.to_landmark = np.array([single_source_dijkstra(reverse_graph, l).distances for l in self.landmarks])
+
+    def heuristic(self, destination):
+        """
+        :param destination: vertex at the end of the path
+        :return: A* heuristic bounding the distance to the destination
+        """
+        from_landmark = self.from_landmark
+        to_landmark = self.to_landmark
+        from_target = from_landmark[:, destination]
+        to_target = to_landmark[:, destination]
+
+        def heuristic(v):
+            with np.errstate(invalid="ignore"):
+                bounds = np.concatenate((from_target - from_landmark[:, v], to_landmark[:, v] - to_target))
+
+            # a landmark which reaches neither vertex gives no bound
+            return float(np.max(np.nan_to_num(bounds, nan=0.0), initial=0.0))
+
+        return heuristic
+
+
+def shortest_path(graph, source, destination, cache=None):
+    """
+    :param cache: optional ShortestPathCache of the graph, which answers
+                  repeated queries from the same source without searching
+    """
+    if cache is None:
+        result = single_source_dijkstra(graph, source, destination)
+    else:
+        if cache.graph is not graph:
+            raise ValueError("The cache holds the shortest paths of another graph")
+
+        result = cache.get(source)
+
+    path = result.path_to(destination)
+
+    if path is None:
+        print("There is no path from %d to %d" % (source, destination))
+    else:
+        print("Shortest Path is: ", path)
+
+
+if __name__ == "__main__":
+
+    # this is an undirected unweighted graph
+    g = AdjacencyMatrixGraph(9, directed=False)
+
+    # add the edges to the graph
+    g.add_edge(0, 1, 1)
+    g.add_edge(1, 2, 2)
+    g.add_edge(1, 3, 6)
+    g.add_edge(2, 3, 2)
+    g.add_edge(1, 4, 3)
+    g.add_edge(3, 5, 1)
+    g.add_edge(5, 4, 5)
+    g.add_edge(3, 6, 1)
+    g.add_edge(6, 7, 1)
+    g.add_edge(0, 7, 8)
+
+    shortest_path(g, 0, 6)
+    shortest_path(g, 4, 7)
+    shortest_path(g, 7, 0)
@@ -0,0 +1,75 @@
+import numpy as np
+
+
+class DisjointSet:
+    """
+    A disjoint set forest (union-find) over the vertices 0 to size - 1.
+    Every set is a tree whose root identifies the set, stored as a flat
+    array holding the parent of every vertex.
+
+    Union by rank keeps the trees shallow and find compresses the path it
+    walks, so any sequence of operations takes close to constant time per
+    operation.
+    """
+    def __init__(self, size):
+        """
+        :param size: number of vertices, every vertex starts in its own set
+        """
+        self.parent = np.arange(size, dtype=np.int64)
+        self.rank = np.zeros(size, dtype=np.int8)
+        self.num_sets = size
+
+    def find(self, v):
+        """
+        :param v: vertex whose set we want to find
+        :return: the root of the set holding the vertex
+        """
+        parent = self.parent
+
+        root = v
+        while parent[root] != root:
+            root = parent[root]
+
+        # point every vertex on the path directly at the root
+        while parent[v] != root:
+            parent[v], v = root, parent[v]
+
+        return int(root)
+
+    def union(self, v1, v2):
+        """
+        Merges the sets holding the two vertices
+
+        :return: True if the vertices were in different sets, False otherwise
+        """
+        root1 = self.find(v1)
+        root2 = self.find(v2)
+
+        if root1 == root2:
+            return False
+
+        # the shallower tree is attached below the root of the deeper one
+        if self.rank[root1] < self.rank[root2]:
+            root1, root2 = root2, root1
+
+        self.parent[root2] = root1
+        if self.rank[root1] == self.rank[root2]:
+            self.rank[root1] += 1
+
+        self.num_sets -= 1
+        return True
+
+    def labels(self):
+        """
+        Fully compresses every path at once
+
+        :return: array holding the root of the set of every vertex, a copy
+                 the caller may change without touching the sets
+        """
+        parent = self.parent
+
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                return parent.copy()
+            parent[:] = grandparent
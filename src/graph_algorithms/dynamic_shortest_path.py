@@ -0,0 +1,243 @@
+import heapq
+import numpy as np
+from .dijkstra import ShortestPathResult, single_source_dijkstra
+from .graph import AdjacencySetGraph
+
+
+class DynamicShortestPaths:
+    """
+    Keeps the shortest paths from a single source up to date while the
+    weights of the graph change, in the manner of Ramalingam and Reps.
+
+    A batch of changes is repaired in two phases. Edges which got heavier
+    or were removed only matter if they are on the shortest path tree, and
+    then only the subtree below them loses its distances. Those vertices
+    are given the best distance offered by the rest of the graph, and a
+    Dijkstra search seeded with them and with the ends of every edge which
+    got lighter or was added settles exactly the vertices whose distance
+    changes. Vertices far from the changes are never looked at.
+
+    Edges must be changed through update, the maintainer raises ValueError
+    if the graph was changed behind its back.
+    """
+    def __init__(self, graph, source, distance_table=None):
+        """
+        :param graph: graph with non-negative edge weights
+        :param source: vertex the shortest paths start from
+        :param distance_table: optional result of build_distance_table for
+                               the graph and source to start from, the
+                               shortest paths are searched for if omitted
+        """
+        if graph.signed_weights and graph.num_vertices > 0:
+            csr_graph = graph.to_csr()
+            if len(csr_graph.weights) > 0 and csr_graph.weights.min() < 0:
+                raise ValueError("Shortest paths cannot be maintained with negative edge weights")
+
+        self.graph = graph
+        self.source = source
+
+        if distance_table is None:
+            result = single_source_dijkstra(graph, source)
+            self.distances, self.predecessors = result.distances, result.predecessors
+        else:
+            self.distances = np.full(graph.num_vertices, np.inf)
+            self.predecessors = np.full(graph.num_vertices, -1, dtype=np.int64)
+
+            for v_id, (distance, predecessor) in distance_table.items():
+                if distance is not None:
+                    self.distances[v_id] = distance
+                    self.predecessors[v_id] = predecessor
+
+        # a directed graph needs the vertices leading into every vertex to
+        # find a new path to a vertex cut off from the source
+        if graph.directed:
+            self._in_neighbours = [set() for _ in range(graph.num_vertices)]
+            for v in range(graph.num_vertices):
+                for neighbour in graph.get_adjacent_vertices(v):
+                    self._in_neighbours[int(neighbour)].add(v)
+
+        self._version = graph.version
+
+    def _get_in_neighbours(self, v):
+        if self.graph.directed:
+            return self._in_neighbours[v]
+
+        return self.graph.get_adjacent_vertices(v)
+
+    def _apply(self, v1, v2, weight):
+        """
+        Applies a single change to the graph
+
+        :return: the weight of the edge before and after the change, 0 for no edge
+        """
+        old_weight = self.graph.get_edge_weight(v1, v2)
+
+        if weight is None or weight == 0:
+            self.graph.remove_edge(v1, v2)
+            weight = 0
+
+            if self.graph.directed:
+                self._in_neighbours[v2].discard(v1)
+        else:
+            if weight < 0:
+                raise ValueError("Shortest paths cannot be maintained with negative edge weights")
+
+            if old_weight == 0:
+                self.graph.add_edge(v1, v2, weight)
+
+                if self.graph.directed:
+                    self._in_neighbours[v2].add(v1)
+            else:
+                self.graph.update_weight(v1, v2, weight)
+
+        return old_weight, weight
+
+    def update(self, changes):
+        """
+        Applies a batch of edge changes to the graph and repairs the
+        shortest paths
+
+        :param changes: iterable of (v1, v2, weight) tuples. An edge which does
+                        not exist is added, one which exists gets the new
+                        weight, and a weight of None removes the edge. If a
+                        change fails the batch is undone and the error raised
+        :return: number of vertices whose shortest path was searched for again
+        """
+        if self.graph.version != self._version:
+            raise ValueError("The graph was changed outside of update, the shortest paths are stale")
+
+        distances, predecessors = self.distances, self.predecessors
+
+        # the vertices whose path from the source used an edge which got
+        # heavier, and the edges which may offer shorter paths
+        cut_off = []
+        improved = []
+
+        # the edges changed so far with their weight before the change
+        applied = []
+
+        try:
+            for v1, v2, weight in changes:
+                old_weight, new_weight = self._apply(v1, v2, weight)
+                applied.append((v1, v2, old_weight))
+
+                arcs = [(v1, v2)] if self.graph.directed else [(v1, v2), (v2, v1)]
+
+                for u, v in arcs:
+                    if old_weight != 0 and (new_weight == 0 or new_weight > old_weight):
+                        if predecessors[v] == u and v != self.source:
+                            cut_off.append(v)
+                    if new_weight != 0 and (old_weight == 0 or new_weight < old_weight):
+                        improved.append((u, v))
+        except Exception:
+            # the changes before the failing one are undone, which leaves the
+            # graph as the current shortest paths describe it
+            for v1, v2, old_weight in reversed(applied):
+                self._apply(v1, v2, old_weight)
+
+            self._version = self.graph.version
+            raise
+
+        self._version = self.graph.version
+
+        # phase 1: forget the distances of the subtrees below the cut off
+        # vertices, walking the tree through the edges of the graph
+        affected = set()
+        stack = list(cut_off)
+
+        while stack:
+            vertex = stack.pop()
+            if vertex in affected:
+                continue
+
+            affected.add(vertex)
+
+            for neighbour in self.graph.get_adjacent_vertices(vertex):
+                if predecessors[neighbour] == vertex and neighbour not in affected:
+                    stack.append(int(neighbour))
+
+        for vertex in affected:
+            distances[vertex] = np.inf
+            predecessors[vertex] = -1
+
+        # phase 2: every forgotten vertex starts from the best edge into it
+        # from the rest of the graph, every lighter edge offers its end
+        heap = []
+
+        for vertex in affected:
+            for neighbour in self._get_in_neighbours(vertex):
+                if neighbour not in affected and predecessors[neighbour] != -1:
+                    distance = distances[neighbour] + self.graph.get_edge_weight(neighbour, vertex)
+                    heap.append((distance, vertex, int(neighbour)))
+
+        # a later change in the batch may have made the edge heavier again
+        # or removed it, so its weight is read from the graph as it is now
+        for u, v in improved:
+            weight = self.graph.get_edge_weight(u, v)
+
+            if weight != 0 and predecessors[u] != -1 and distances[u] + weight < distances[v]:
+                heap.append((distances[u] + weight, v, u))
+
+        heapq.heapify(heap)
+
+        changed = set(affected)
+
+        while heap:
+            current_dist, current_vertex, predecessor = heapq.heappop(heap)
+
+            # entries whose vertex has since found a shorter path are skipped
+            if current_dist >= distances[current_vertex]:
+                continue
+
+            distances[current_vertex] = current_dist
+            predecessors[current_vertex] = predecessor
+            changed.add(current_vertex)
+
+            neighbours, weights = self.graph.neighbors_with_weights(current_vertex)
+
+            for neighbour, weight in zip(neighbours.tolist(), weights.tolist()):
+                distance = current_dist + weight
+
+                if distance < distances[neighbour]:
+                    heapq.heappush(heap, (distance, neighbour, current_vertex))
+
+        return len(changed)
+
+    def result(self):
+        """
+        :return: ShortestPathResult holding a copy of the current shortest paths
+        """
+        return ShortestPathResult(self.source, self.distances.copy(), self.predecessors.copy(),
+                                  int(np.count_nonzero(self.predecessors != -1)))
+
+    def distance_table(self):
+        """
+        :return: the shortest paths in the format returned by build_distance_table
+        """
+        return self.result().distance_table()
+
+
+if __name__ == "__main__":
+
+    # this is a directed weighted graph of roads
+    g = AdjacencySetGraph(6, directed=True)
+
+    g.add_edge(0, 1, 2)
+    g.add_edge(0, 2, 5)
+    g.add_edge(1, 2, 2)
+    g.add_edge(1, 3, 4)
+    g.add_edge(2, 3, 1)
+    g.add_edge(3, 4, 3)
+    g.add_edge(2, 5, 8)
+
+    paths = DynamicShortestPaths(g, 0)
+    print("Shortest Path from 0 to 4: ", paths.result().path_to(4))
+
+    # traffic slows the road from 1 to 2 and closes the road from 2 to 3
+    changed = paths.update([(1, 2, 6), (2, 3, None)])
+    print("Vertices changed: ", changed)
+    print("Shortest Path from 0 to 4: ", paths.result().path_to(4))
+
+    # a new road opens from 1 to 4
+    paths.update([(1, 4, 1)])
+    print("Shortest Path from 0 to 4: ", paths.result().path_to(4))
@@ -0,0 +1,177 @@
+from .topological_sort import topological_sort
+
+
+class DynamicTopologicalOrder:
+    """
+    Maintains a topological order of a directed acyclic graph while edges
+    are added and removed, using the algorithm of Pearce and Kelly.
+
+    Adding an edge v1 -> v2 which already agrees with the order costs
+    nothing. Otherwise only the vertices whose position lies between v2
+    and v1 and which are reachable from v2 or reach v1 are searched and
+    shuffled among their own positions, instead of sorting the whole graph
+    again. An edge which would create a cycle is found by the same search
+    and rejected, leaving the graph unchanged.
+    """
+    def __init__(self, num_vertices):
+        """
+        :param num_vertices: Total number of vertices, which start without edges
+        """
+        self.num_vertices = num_vertices
+
+        self._successors = [set() for _ in range(num_vertices)]
+        self._predecessors = [set() for _ in range(num_vertices)]
+
+        # the position of every vertex in the order and the vertex at every position
+        self._position = list(range(num_vertices))
+        self._vertex_at = list(range(num_vertices))
+
+    @classmethod
+    def from_graph(cls, graph):
+        """
+        :param graph: directed acyclic graph to start from
+        :return: the order of the graph, which keeps no reference to the graph
+        """
+        order = cls(graph.num_vertices)
+
+        order._vertex_at = [int(v) for v in topological_sort(graph)]
+        for position, v in enumerate(order._vertex_at):
+            order._position[v] = position
+
+        for v in range(graph.num_vertices):
+            for neighbour in graph.get_adjacent_vertices(v):
+                order._successors[v].add(int(neighbour))
+                order._predecessors[int(neighbour)].add(v)
+
+        return order
+
+    def _check_vertices(self, v1, v2):
+        if v1 >= self.num_vertices or v2 >= self.num_vertices or v1 < 0 or v2 < 0:
+            raise ValueError("Vertices %d and %d are out of bounds" % (v1, v2))
+
+    def _search(self, start, neighbours, in_range, target=None):
+        """
+        Depth first search from start following the given neighbour sets and
+        only entering vertices whose position is in range
+
+        :return: list of the vertices found, None if the target was found
+        """
+        found = [start]
+        seen = {start}
+        stack = [start]
+
+        while stack:
+            vertex = stack.pop()
+
+            for neighbour in neighbours[vertex]:
+                if neighbour == target:
+                    return None
+
+                if neighbour not in seen and in_range(self._position[neighbour]):
+                    seen.add(neighbour)
+                    found.append(neighbour)
+                    stack.append(neighbour)
+
+        return found
+
+    def add_edge(self, v1, v2):
+        """
+        Adds the edge v1 -> v2 and moves vertices so that v1 comes before v2.
+
+        Raises ValueError if the edge would create a cycle.
+        """
+        self._check_vertices(v1, v2)
+
+        if v1 == v2:
+            raise ValueError("The edge %d -> %d would create a cycle" % (v1, v2))
+
+        if v2 in self._successors[v1]:
+            return
+
+        lower_bound = self._position[v2]
+        upper_bound = self._position[v1]
+
+        if lower_bound < upper_bound:
+
+            # the vertices after v2 which must move after v1, and the vertices
+            # before v1 which must move before v2
+            forward = self._search(v2, self._successors, lambda p: p < upper_bound, target=v1)
+            if forward is None:
+                raise ValueError("The edge %d -> %d would create a cycle" % (v1, v2))
+
+            backward = self._search(v1, self._predecessors, lambda p: p > lower_bound)
+
+            self._reorder(backward, forward)
+
+        self._successors[v1].add(v2)
+        self._predecessors[v2].add(v1)
+
+    def _reorder(self, backward, forward):
+        """
+        Reassigns the positions held by the vertices in both lists so that
+        every vertex in backward comes before every vertex in forward, each
+        list keeping its own relative order
+        """
+        position = self._position
+
+        backward.sort(key=position.__getitem__)
+        forward.sort(key=position.__getitem__)
+
+        vertices = backward + forward
+        positions = sorted(position[v] for v in vertices)
+
+        for v, p in zip(vertices, positions):
+            position[v] = p
+            self._vertex_at[p] = v
+
+    def remove_edge(self, v1, v2):
+        """
+        Removes the edge v1 -> v2, the order stays valid without any change.
+
+        Raises ValueError if there is no such edge.
+        """
+        self._check_vertices(v1, v2)
+
+        if v2 not in self._successors[v1]:
+            raise ValueError("There is no edge %d -> %d" % (v1, v2))
+
+        self._successors[v1].remove(v2)
+        self._predecessors[v2].remove(v1)
+
+    def position(self, v):
+        """
+        :return: the position of the vertex in the topological order
+        """
+        return self._position[v]
+
+    def precedes(self, v1, v2):
+        """
+        :return: True if v1 comes before v2 in the topological order
+        """
+        return self._position[v1] < self._position[v2]
+
+    def order(self):
+        """
+        :return: list of all the vertices in topological order
+        """
+        return list(self._vertex_at)
+
+
+if __name__ == "__main__":
+
+    dynamic_order = DynamicTopologicalOrder(6)
+
+    dynamic_order.add_edge(4, 0)
+    dynamic_order.add_edge(3, 1)
+    dynamic_order.add_edge(1, 0)
+    dynamic_order.add_edge(5, 3)
+    print(dynamic_order.order())
+
+    try:
+        dynamic_order.add_edge(0, 5)
+    except ValueError as error:
+        print(error)
+
+    dynamic_order.remove_edge(1, 0)
+    dynamic_order.add_edge(0, 5)
+    print(dynamic_order.order())
@@ -0,0 +1,155 @@
+import numpy as np
+from .graph import AdjacencyMatrixGraph
+
+
+def _weight_matrix(graph, dtype):
+    """
+    :return: square array of edge weights with infinity where there is no edge
+    """
+    if isinstance(graph, AdjacencyMatrixGraph):
+        matrix = graph.matrix
+
+        # filled in place so no float64 copy of the matrix is made on the way
+        weights = np.full(matrix.shape, np.inf, dtype=dtype)
+        np.copyto(weights, matrix, where=matrix != 0)
+    else:
+        src, dst, edge_weights = graph.edges()
+
+        weights = np.full((graph.num_vertices, graph.num_vertices), np.inf, dtype=dtype)
+        weights[src, dst] = edge_weights
+
+    # a vertex is at distance 0 from itself unless it has a negative self loop
+    np.fill_diagonal(weights, np.minimum(np.diagonal(weights), 0))
+    return weights
+
+
+def _relax_tile(distances, predecessors, rows, cols, pivots):
+    """
+    Improves the paths between the vertices of a tile of the distance
+    matrix by letting them pass through each pivot vertex in turn
+
+    :param rows: slice of the start vertices of the tile
+    :param cols: slice of the end vertices of the tile
+    :param pivots: range of the vertices the paths may pass through
+    """
+    tile = distances[rows, cols]
+
+    for k in pivots:
+        # the length of every path in the tile when it passes through k
+        through_k = distances[rows, k][:, np.newaxis] + distances[k, cols][np.newaxis, :]
+
+        if predecessors is None:
+            np.minimum(tile, through_k, out=tile)
+        else:
+            shorter = through_k < tile
+            tile[shorter] = through_k[shorter]
+
+            # a path through k ends the same way as the path from k
+            predecessor_tile = predecessors[rows, cols]
+            predecessor_tile[shorter] = np.broadcast_to(predecessors[k, cols], tile.shape)[shorter]
+
+
+def floyd_warshall(graph, dtype=np.float64, block_size=None, return_predecessors=True):
+    """
+    Floyd-Warshall all pairs shortest paths. Every pivot vertex updates
+    the whole distance matrix with one broadcast array operation.
+
+    With a block size the matrix is split into square tiles and every
+    block of pivots is applied first to its own diagonal tile, then to the
+    tiles in the same row and column, then to the rest. Each step only
+    touches tiles small enough to stay in cache, which pays off once the
+    matrix no longer fits.
+
+    :param graph: graph without negative weight cycles
+    :param dtype: float type of the distances, np.float32 halves the memory
+                  at the cost of precision
+    :param block_size: number of vertices on the side of a tile, the whole
+                       matrix is updated at once if None
+    :param return_predecessors: False to skip the predecessor matrix
+    :return: matrix of the distance from every vertex to every other vertex,
+             infinite where there is no path, and the matrix of the last
+             vertex before the end of every path, -1 where there is no path
+    """
+    num_vertices = graph.num_vertices
+    distances = _weight_matrix(graph, dtype)
+
+    predecessors = None
+    if return_predecessors:
+        # both choices are int32 so the result already is
+        predecessors = np.where(np.isfinite(distances),
+                                np.arange(num_vertices, dtype=np.int32)[:, np.newaxis],
+                                np.int32(-1))
+
+    if block_size is None:
+        _relax_tile(distances, predecessors, slice(None), slice(None), range(num_vertices))
+    else:
+        blocks = [slice(start, min(start + block_size, num_vertices))
+                  for start in range(0, num_vertices, block_size)]
+
+        for pivot_block in blocks:
+            pivots = range(pivot_block.start, pivot_block.stop)
+
+            # the tile where the pivot rows and columns cross
+            _relax_tile(distances, predecessors, pivot_block, pivot_block, pivots)
+
+            # the tiles in the same rows and columns as the pivots
+            for block in blocks:
+                if block != pivot_block:
+                    _relax_tile(distances, predecessors, pivot_block, block, pivots)
+                    _relax_tile(distances, predecessors, block, pivot_block, pivots)
+
+            # every other tile
+            for row_block in blocks:
+                for col_block in blocks:
+                    if row_block != pivot_block and col_block != pivot_block:
+                        _relax_tile(distances, predecessors, row_block, col_block, pivots)
+
+    # a vertex on a negative weight cycle has a negative path to itself
+    if (np.diagonal(distances) < 0).any():
+        raise ValueError("The graph has a negative weight cycle")
+
+    return distances, predecessors
+
+
+def floyd_warshall_path(predecessors, source, destination):
+    """
+    :param predecessors: predecessor matrix returned by floyd_warshall
+    :return: list of vertices on the shortest path from source to destination,
+             None if there is no path
+    """
+    if predecessors[source, destination] == -1:
+        return None
+
+    path = [destination]
+
+    while destination != source:
+        destination = int(predecessors[source, destination])
+        path.append(destination)
+
+    path.reverse()
+    return path
+
+
+if __name__ == "__main__":
+
+    # this is an undirected weighted graph
+    g = AdjacencyMatrixGraph(9, directed=False)
+
+    # add the edges to the graph
+    g.add_edge(0, 1, 1)
+    g.add_edge(1, 2, 2)
+    g.add_edge(1, 3, 6)
+    g.add_edge(2, 3, 2)
+    g.add_edge(1, 4, 3)
+    g.add_edge(3, 5, 1)
+    g.add_edge(5, 4, 5)
+    g.add_edge(3, 6, 1)
+    g.add_edge(6, 7, 1)
+    g.add_edge(0, 7, 8)
+
+    distance_matrix, predecessor_matrix = floyd_warshall(g, block_size=4)
+
+    print(distance_matrix)
+    print("Shortest Path is: ", floyd_warshall_path(predecessor_matrix, 0, 6))
+    print("Shortest Path is: ", floyd_warshall_path(predecessor_matrix, 7, 0))
+    print("Shortest Path is: ", floyd_warshall_path(predecessor_matrix, 0, 8))
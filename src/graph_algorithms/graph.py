@@ -0,0 +1,997 @@
+import abc
+import itertools
+import numpy as np
+
+
+class Graph(abc.ABC):
+    """
+    The base class representation of a graph with all the
+    interface methods.
+    """
+    def __init__(self, num_vertices, directed=False, signed_weights=False):
+        """
+        :param num_vertices: Total number of vertices present in the graph
+        :param directed: True if the graph is directed, False otherwise
+        :param signed_weights: True to allow negative and fractional edge
+                               weights, otherwise every weight must be >= 1
+        """
+        self.num_vertices = num_vertices
+        self.directed = directed
+        self.signed_weights = signed_weights
+
+        # counts the changes made to the edges, anything computed from the
+        # graph is stale once the version has moved on
+        self.version = 0
+
+        # the CSRGraph built by to_csr and the version it was built for
+        self._csr_view = None
+        self._csr_version = None
+
+    @abc.abstractmethod
+    def add_edge(self, v1, v2, weight):
+        """
+        :param v1: vertex of the edge
+        :param v2: vertex of the edge
+        :param weight: weight of the edge connecting vertices v1 and v2
+        :return:
+        """
+        pass
+
+    @abc.abstractmethod
+    def add_edges(self, src, dst, weights=None):
+        """
+        Adds many edges at once, the edge i connects src[i] and dst[i]
+
+        :param src: array of vertices where the edges start
+        :param dst: array of vertices where the edges end
+        :param weights: array of edge weights, every edge has weight 1 if omitted
+        :return:
+        """
+        pass
+
+    @abc.abstractmethod
+    def remove_edge(self, v1, v2):
+        """
+        Removes the edge between the vertices, raises ValueError if there is none
+
+        :param v1: vertex of the edge
+        :param v2: vertex of the edge
+        :return:
+        """
+        pass
+
+    @abc.abstractmethod
+    def update_weight(self, v1, v2, weight):
+        """
+        Changes the weight of the edge between the vertices, raises
+        ValueError if there is no such edge
+
+        :param v1: vertex of the edge
+        :param v2: vertex of the edge
+        :param weight: new weight of the edge connecting vertices v1 and v2
+        :return:
+        """
+        pass
+
+    @abc.abstractmethod
+    def get_adjacent_vertices(self, v):
+        """
+        :param v: vertex whose adjacent vertices we want to retrieve
+        :return: all the vertices adjacent to the given vertex
+        """
+        pass
+
+    @abc.abstractmethod
+    def get_in_degree(self, v):
+        """
+
+        :param v: vertex whose in-degree we wish to compute
+        :return:  number of edges which are incident on the given vertex
+        """
+        pass
+
+    @abc.abstractmethod
+    def get_edge_weight(self, v1, v2):
+        """
+
+        :param v1: vertex of the edge whose weight we wish to retrieve
+        :param v2: vertex of the edge whose weight we wish to retrieve
+        :return: return the weight of the edge connecting vertex v1 and v2
+        """
+        pass
+
+    @abc.abstractmethod
+    def display(self):
+        """
+        This method displays the graph
+        """
+        pass
+
+    def neighbors_with_weights(self, v):
+        """
+        Reads every edge leaving a vertex in one call, rather than a call to
+        get_edge_weight for every neighbour
+
+        :param v: vertex whose adjacent vertices we want to retrieve
+        :return: array of the vertices adjacent to the given vertex in sorted
+                 order, and array of the weights of the edges leading to them
+        """
+        neighbours = np.asarray(self.get_adjacent_vertices(v), dtype=np.int64)
+        weights = np.array([self.get_edge_weight(v, neighbour) for neighbour in neighbours.tolist()])
+
+        return neighbours, weights
+
+    def edges(self):
+        """
+        :return: the src, dst and weights arrays of every edge in the graph
+                 sorted by src and then dst, an undirected edge appears once
+                 in each direction
+        """
+        src, dst, weights = [], [], []
+
+        for v in range(self.num_vertices):
+            neighbours, neighbour_weights = self.neighbors_with_weights(v)
+
+            src.append(np.full(len(neighbours), v, dtype=np.int64))
+            dst.append(neighbours)
+            weights.append(neighbour_weights)
+
+        if self.num_vertices == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0)
+
+        return np.concatenate(src), np.concatenate(dst), np.concatenate(weights).astype(np.float64)
+
+    def to_csr(self):
+        """
+        :return: a read-only CSRGraph holding the same edges as this graph.
+                 It is kept until the graph changes, so repeated queries do
+                 not rebuild it
+        """
+        if self._csr_view is not None and self._csr_version == self.version:
+            return self._csr_view
+
+        src, dst, weights = self.edges()
+
+        # the edges already list both directions of undirected edges, so they
+        # are merged as directed ones before the graph takes its direction
+        csr_graph = CSRGraph(self.num_vertices, directed=True, signed_weights=self.signed_weights)
+        csr_graph.add_edges(src, dst, weights)
+        csr_graph._compile()
+        csr_graph.directed = self.directed
+        csr_graph.read_only = True
+
+        self._csr_view = csr_graph
+        self._csr_version = self.version
+
+        return csr_graph
+
+    def _check_weight(self, weight):
+        """
+        Raises ValueError if the graph cannot hold an edge of this weight.
+        A weight of 0 is never allowed as it marks a missing edge.
+        """
+        if self.signed_weights:
+            if weight == 0:
+                raise ValueError("An edge cannot have weight 0")
+
+        # check if the weight is positive
+        elif weight < 1:
+            raise ValueError("An edge cannot have weight < 1")
+
+    def _check_edge_arrays(self, src, dst, weights):
+        """
+        Converts the arguments of add_edges to arrays and checks all the
+        vertices in a single pass
+
+        :return: the src, dst and weights arrays
+        """
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+
+        if weights is None:
+            weights = np.ones(len(src))
+        else:
+            weights = np.asarray(weights, dtype=np.float64)
+
+        if src.ndim != 1 or src.shape != dst.shape or src.shape != weights.shape:
+            raise ValueError("src, dst and weights must be one dimensional arrays of the same length")
+
+        # check if the vertices are valid
+        out_of_bounds = (src >= self.num_vertices) | (dst >= self.num_vertices) | (src < 0) | (dst < 0)
+        if out_of_bounds.any():
+            i = np.argmax(out_of_bounds)
+            raise ValueError("Vertices %d and %d are out of bounds" % (src[i], dst[i]))
+
+        # check the lightest edge, or any edge of weight 0
+        if len(weights) > 0:
+            self._check_weight(weights.min())
+            if self.signed_weights and not weights.all():
+                self._check_weight(0)
+
+        return src, dst, weights
+
+    @classmethod
+    def from_edge_list(cls, path, num_vertices=None, directed=False, chunk_size=1000000, signed_weights=False):
+        """
+        Builds a graph from a text file holding one edge per line as
+        "v1 v2" or "v1 v2 weight", separated by whitespace or commas. Every
+        line must have as many columns as the first, edges without a weight
+        have weight 1. Blank lines and lines starting with # are skipped.
+
+        Called on Graph itself the graph is a CSRGraph.
+
+        The file is read chunk_size lines at a time so the whole file is
+        never held in memory.
+
+        :param path: path of the edge list file
+        :param num_vertices: number of vertices in the graph, if omitted the
+                             file is read twice and the largest vertex id is used
+        :param directed: True if the graph is directed, False otherwise
+        :param chunk_size: number of lines parsed in one go
+        :param signed_weights: True to allow negative and fractional edge weights
+        :return: the graph holding every edge in the file
+        """
+        # the base class cannot be instantiated, CSR suits a graph read in bulk
+        if cls is Graph:
+            cls = CSRGraph
+
+        if num_vertices is None:
+            num_vertices = 0
+            for src, dst, _ in _read_edge_chunks(path, chunk_size):
+                num_vertices = max(num_vertices, int(src.max()) + 1, int(dst.max()) + 1)
+
+        graph = cls(num_vertices, directed=directed, signed_weights=signed_weights)
+
+        for src, dst, weights in _read_edge_chunks(path, chunk_size):
+            graph.add_edges(src, dst, weights)
+
+        return graph
+
+
+def _read_edge_chunks(path, chunk_size):
+    """
+    Parses an edge list file lazily
+
+    :return: generator of (src, dst, weights) arrays with at most chunk_size edges each
+    """
+    with open(path) as edge_file:
+        lines = (line for line in edge_file if line.strip() and not line.lstrip().startswith("#"))
+
+        # the number of columns of the first chunk, which every chunk must match
+        num_columns = None
+
+        while True:
+            chunk = list(itertools.islice(lines, chunk_size))
+            if not chunk:
+                return
+
+            delimiter = "," if "," in chunk[0] else None
+
+            try:
+                edges = np.loadtxt(chunk, delimiter=delimiter, ndmin=2)
+            except ValueError:
+                # the lines are only counted once parsing failed, so a well
+                # formed file is not split twice
+                if len({len(line.replace(",", " ").split()) for line in chunk}) > 1:
+                    edges = None
+                else:
+                    raise
+
+            if num_columns is None and edges is not None:
+                num_columns = edges.shape[1]
+
+            if edges is None or edges.shape[1] != num_columns:
+                raise ValueError("Every line of %s must have as many columns as the first edge" % path)
+
+            if num_columns == 2:
+                weights = np.ones(len(edges))
+            elif num_columns == 3:
+                weights = edges[:, 2]
+            else:
+                raise ValueError("An edge must be given as 'v1 v2' or 'v1 v2 weight'")
+
+            yield edges[:, 0].astype(np.int64), edges[:, 1].astype(np.int64), weights
+
+
+class AdjacencyMatrixGraph(Graph):
+    """
+    Represents a graph as an adjacency matrix. A cell in the matrix has
+    a value when there exists an edge between the vertex represented by
+    the row and column numbers.
+
+    Weighted graphs can hold values > 1 in the matrix cells, or any non
+    zero value when the graph allows signed weights. A value of 0 in the
+    cell indicates that there is no edge
+    """
+
+    def __init__(self, num_vertices, directed=False, signed_weights=False):
+        super(AdjacencyMatrixGraph, self).__init__(num_vertices, directed, signed_weights)
+
+        self.matrix = np.zeros((num_vertices, num_vertices))
+
+        # the in-degree of every vertex, computed lazily and discarded
+        # whenever an edge is added
+        self._in_degree = None
+
+    def add_edge(self, v1, v2, weight=1):
+
+        # check if the vertices are valid
+        if v1 >= self.num_vertices or v2 >= self.num_vertices or v1 < 0 or v2 < 0:
+            raise ValueError("Vertices %d and %d are out of bounds" % (v1, v2))
+
+        self._check_weight(weight)
+
+        # assign the weight to the edge between the specified vertices
+        self.matrix[v1][v2] = weight
+
+        # in case the graph is undirected, we need an edge which goes in the opposite direction as well
+        if not self.directed:
+            self.matrix[v2][v1] = weight
+
+        self._in_degree = None
+        self.version += 1
+
+    def add_edges(self, src, dst, weights=None):
+        src, dst, weights = self._check_edge_arrays(src, dst, weights)
+
+        # in case the graph is undirected, every edge is followed by the
+        # one which goes in the opposite direction
+        if not self.directed:
+            src, dst = np.column_stack((src, dst)).ravel(), np.column_stack((dst, src)).ravel()
+            weights = np.repeat(weights, 2)
+
+        # when a cell is assigned more than once the last weight wins, just
+        # as if the edges had been added one at a time
+        cells = src * self.num_vertices + dst
+        _, last = np.unique(cells[::-1], return_index=True)
+        last = len(cells) - 1 - last
+
+        self.matrix[src[last], dst[last]] = weights[last]
+
+        self._in_degree = None
+        self.version += 1
+
+    def _check_edge(self, v1, v2):
+
+        # check if the vertices are valid
+        if v1 >= self.num_vertices or v2 >= self.num_vertices or v1 < 0 or v2 < 0:
+            raise ValueError("Vertices %d and %d are out of bounds" % (v1, v2))
+
+        if self.matrix[v1][v2] == 0:
+            raise ValueError("There is no edge between vertices %d and %d" % (v1, v2))
+
+    def remove_edge(self, v1, v2):
+        self._check_edge(v1, v2)
+
+        # a cell holding 0 has no edge
+        self.matrix[v1][v2] = 0
+
+        if not self.directed:
+            self.matrix[v2][v1] = 0
+
+        self._in_degree = None
+        self.version += 1
+
+    def update_weight(self, v1, v2, weight):
+        self._check_edge(v1, v2)
+        self._check_weight(weight)
+
+        self.matrix[v1][v2] = weight
+
+        if not self.directed:
+            self.matrix[v2][v1] = weight
+
+        self.version += 1
+
+    def get_adjacent_vertices(self, v):
+
+        # check if the vertex is valid
+        if v >= self.num_vertices or v < 0:
+            raise ValueError("Vertex %d is out of bounds" % v)
+
+        # the columns holding an edge weight in the row of this vertex
+        return np.flatnonzero(self.matrix[v]).tolist()
+
+    def get_in_degree(self, v):
+
+        # check if the vertex is valid
+        if v >= self.num_vertices or v < 0:
+            raise ValueError("Vertex %d is out of bounds" % v)
+
+        # count the edges in every column at once, so that asking for the
+        # in-degree of each vertex in turn is a lookup rather than a scan
+        if self._in_degree is None:
+            self._in_degree = np.count_nonzero(self.matrix, axis=0)
+
+        return int(self._in_degree[v])
+
+    def get_edge_weight(self, v1, v2):
+
+        # check if the vertices are valid
+        if v1 >= self.num_vertices or v2 >= self.num_vertices or v1 < 0 or v2 < 0:
+            raise ValueError("Vertices %d and %d are out of bounds" % (v1, v2))
+
+        return self.matrix[v1][v2]
+
+    def neighbors_with_weights(self, v):
+
+        # check if the vertex is valid
+        if v >= self.num_vertices or v < 0:
+            raise ValueError("Vertex %d is out of bounds" % v)
+
+        row = self.matrix[v]
+        neighbours = np.flatnonzero(row)
+
+        return neighbours, row[neighbours]
+
+    def edges(self):
+        src, dst = np.nonzero(self.matrix)
+
+        return src, dst, self.matrix[src, dst]
+
+    def display(self):
+        for from_vertex in range(self.num_vertices):
+            for to_vertex in self.get_adjacent_vertices(from_vertex):
+                print(from_vertex, "-->", to_vertex)
+
+
+class Node:
+    """
+    A single node in a graph represented by an adjacency set. Every node
+    has a vertex id and is associated with its adjacent vertices and the
+    weights of the edges leading to them.
+
+    Nodes declare __slots__ so that a graph with many vertices does not
+    pay for an attribute dictionary on every node.
+    """
+    __slots__ = ("vertex_id", "adjacency", "_sorted_adjacency")
+
+    def __init__(self, vertex_id):
+        """
+
+        :param vertex_id: A unique number ranging from 0 to num_vertices - 1
+        """
+        self.vertex_id = vertex_id
+
+        # maps every adjacent vertex to the weight of the edge leading to it
+        self.adjacency = {}
+
+        # the adjacent vertices in sorted order, rebuilt after a change. It is
+        # a tuple as it is handed to every caller without a copy
+        self._sorted_adjacency = ()
+
+    def add_edge(self, v, weight=1):
+        """
+        :return: True if the edge is new, False if only its weight changed
+        """
+
+        # check if the vertex is valid
+        if self.vertex_id == v:
+            raise ValueError("Vertex %d cannot be adjacent to itself" % v)
+
+        is_new = v not in self.adjacency
+        self.adjacency[v] = weight
+
+        if is_new:
+            self._sorted_adjacency = None
+
+        return is_new
+
+    def remove_edge(self, v):
+        del self.adjacency[v]
+        self._sorted_adjacency = None
+
+    def get_adjacency_set(self):
+        if self._sorted_adjacency is None:
+            self._sorted_adjacency = tuple(sorted(self.adjacency))
+
+        return self._sorted_adjacency
+
+    def get_adjacency_arrays(self):
+        """
+        :return: arrays of the sorted adjacent vertices and of the weights of
+                 the edges leading to them. They are built on every call
+                 rather than kept, two arrays on every node would cost more
+                 memory than the rest of the node
+        """
+        neighbours = self.get_adjacency_set()
+
+        return np.array(neighbours, dtype=np.int64), np.array([self.adjacency[v] for v in neighbours])
+
+
+class AdjacencySetGraph(Graph):
+    """
+    Represents a graph as an adjacency set. A graph is a list of Nodes
+    and each node has a set of adjacent vertices along with the weights
+    of the edges leading to them.
+
+    The in-degree of every vertex is counted as edges are added and
+    removed, so it never needs a scan over the graph.
+    """
+    def __init__(self, num_vertices, directed=False, signed_weights=False):
+        super(AdjacencySetGraph, self).__init__(num_vertices, directed, signed_weights)
+
+        self.vertices = [Node(vertex_id) for vertex_id in range(num_vertices)]
+        self._in_degree = np.zeros(num_vertices, dtype=np.int64)
+
+    def _add_edge(self, v1, v2, weight):
+        if self.vertices[v1].add_edge(v2, weight):
+            self._in_degree[v2] += 1
+
+        if not self.directed:
+            if self.vertices[v2].add_edge(v1, weight):
+                self._in_degree[v1] += 1
+
+    def add_edge(self, v1, v2, weight=1):
+
+        # check if the vertices are valid
+        if v1 >= self.num_vertices or v2 >= self.num_vertices or v1 < 0 or v2 < 0:
+            raise ValueError("Vertices %d and %d are out of bounds" % (v1, v2))
+
+        self._check_weight(weight)
+
+        self._add_edge(v1, v2, weight)
+        self.version += 1
+
+    def add_edges(self, src, dst, weights=None):
+        src, dst, weights = self._check_edge_arrays(src, dst, weights)
+
+        loops = src == dst
+        if loops.any():
+            raise ValueError("Vertex %d cannot be adjacent to itself" % src[np.argmax(loops)])
+
+        for v1, v2, weight in zip(src.tolist(), dst.tolist(), weights.tolist()):
+            self._add_edge(v1, v2, weight)
+
+        self.version += 1
+
+    def remove_edge(self, v1, v2):
+
+        # check if the vertices are valid
+        if v1 >= self.num_vertices or v2 >= self.num_vertices or v1 < 0 or v2 < 0:
+            raise ValueError("Vertices %d and %d are out of bounds" % (v1, v2))
+
+        if v2 not in self.vertices[v1].adjacency:
+            raise ValueError("There is no edge between vertices %d and %d" % (v1, v2))
+
+        self.vertices[v1].remove_edge(v2)
+        self._in_degree[v2] -= 1
+
+        if not self.directed:
+            self.vertices[v2].remove_edge(v1)
+            self._in_degree[v1] -= 1
+
+        self.version += 1
+
+    def update_weight(self, v1, v2, weight):
+
+        # check if the vertices are valid
+        if v1 >= self.num_vertices or v2 >= self.num_vertices or v1 < 0 or v2 < 0:
+            raise ValueError("Vertices %d and %d are out of bounds" % (v1, v2))
+
+        if v2 not in self.vertices[v1].adjacency:
+            raise ValueError("There is no edge between vertices %d and %d" % (v1, v2))
+
+        self._check_weight(weight)
+
+        # the edge exists, so only its weight changes
+        self._add_edge(v1, v2, weight)
+        self.version += 1
+
+    def get_adjacent_vertices(self, v):
+
+        # check if the vertex is valid
+        if v >= self.num_vertices or v < 0:
+            raise ValueError("Vertex %d is out of bounds" % v)
+
+        return self.vertices[v].get_adjacency_set()
+
+    def neighbors_with_weights(self, v):
+
+        # check if the vertex is valid
+        if v >= self.num_vertices or v < 0:
+            raise ValueError("Vertex %d is out of bounds" % v)
+
+        return self.vertices[v].get_adjacency_arrays()
+
+    def get_in_degree(self, v):
+
+        # check if the vertex is valid
+        if v >= self.num_vertices or v < 0:
+            raise ValueError("Vertex %d is out of bounds" % v)
+
+        return int(self._in_degree[v])
+
+    def get_edge_weight(self, v1, v2):
+
+        # check if the vertices are valid
+        if v1 >= self.num_vertices or v2 >= self.num_vertices or v1 < 0 or v2 < 0:
+            raise ValueError("Vertices %d and %d are out of bounds" % (v1, v2))
+
+        return self.vertices[v1].adjacency.get(v2, 0)
+
+    def display(self):
+        for from_vertex in range(self.num_vertices):
+            for to_vertex in self.get_adjacent_vertices(from_vertex):
+                print(from_vertex, "-->", to_vertex)
+
+
+class CSRGraph(Graph):
+    """
+    Represents a graph in compressed sparse row (CSR) form. The vertices
+    adjacent to vertex v are stored in indices[indptr[v]:indptr[v + 1]],
+    sorted by vertex id, and the weights of those edges are stored at the
+    same positions in weights. Memory therefore grows with O(V + E) rather
+    than O(V^2) as with the adjacency matrix.
+
+    Edges added with add_edge are buffered and merged into the arrays the
+    next time the graph is queried, so building a graph edge by edge does
+    not rebuild the arrays on every call. Adding an edge which already
+    exists replaces its weight.
+    """
+
+    def __init__(self, num_vertices, directed=False, signed_weights=False):
+        super(CSRGraph, self).__init__(num_vertices, directed, signed_weights)
+
+        self._indptr = np.zeros(num_vertices + 1, dtype=np.int64)
+        self._indices = np.zeros(0, dtype=np.int32)
+        self._weights = np.zeros(0, dtype=np.float64)
+
+        # edges which have been added but not yet merged into the arrays,
+        # single edges are collected in lists and bulk edges as array chunks
+        self._pending_src = []
+        self._pending_dst = []
+        self._pending_weights = []
+        self._pending_chunks = []
+
+        # the in-degree of every vertex, computed lazily
+        self._in_degree = None
+
+        # the graph built by reverse and the version it was built for
+        self._reverse = None
+        self._reverse_version = None
+
+        # graphs backed by read-only arrays, such as memory mapped files,
+        # cannot have edges added to them
+        self.read_only = False
+
+    @classmethod
+    def from_arrays(cls, indptr, indices, weights, directed=False, read_only=False, signed_weights=False):
+        """
+        Wraps existing CSR arrays in a graph without copying them. The
+        neighbours of every vertex must already be sorted and an undirected
+        graph must list every edge in both directions.
+
+        :param indptr: array of num_vertices + 1 offsets into indices
+        :param indices: array of the adjacent vertices of every vertex
+        :param weights: array of the weight of every edge in indices
+        :param directed: True if the graph is directed, False otherwise
+        :param read_only: True if edges cannot be added to the graph
+        :param signed_weights: True if the weights may be negative or fractional
+        :return: the graph backed by the given arrays
+        """
+        if len(indices) != len(weights) or indptr[-1] != len(indices):
+            raise ValueError("indptr, indices and weights do not describe the same edges")
+
+        graph = cls(len(indptr) - 1, directed, signed_weights)
+
+        graph._indptr = indptr
+        graph._indices = indices
+        graph._weights = weights
+        graph.read_only = read_only
+
+        return graph
+
+    @property
+    def indptr(self):
+        self._compile()
+        return self._indptr
+
+    @property
+    def indices(self):
+        self._compile()
+        return self._indices
+
+    @property
+    def weights(self):
+        self._compile()
+        return self._weights
+
+    def _compile(self):
+        """
+        Merges the buffered edges into the indptr, indices and weights arrays
+        """
+        if not self._has_pending_edges():
+            return
+
+        self._flush_pending_edges()
+
+        new_src = np.concatenate([chunk[0] for chunk in self._pending_chunks])
+        new_dst = np.concatenate([chunk[1] for chunk in self._pending_chunks])
+        new_weights = np.concatenate([chunk[2] for chunk in self._pending_chunks])
+
+        # the position of every edge in the order it was added
+        new_order = np.arange(len(new_src))
+
+        self._pending_chunks = []
+
+        # in case the graph is undirected, every edge is stored in both directions
+        if not self.directed:
+            reverse = new_src != new_dst
+            new_src, new_dst = (np.concatenate((new_src, new_dst[reverse])),
+                                np.concatenate((new_dst, new_src[reverse])))
+            new_weights = np.concatenate((new_weights, new_weights[reverse]))
+            new_order = np.concatenate((new_order, new_order[reverse]))
+
+        old_src = np.repeat(np.arange(self.num_vertices, dtype=np.int64), np.diff(self._indptr))
+
+        src = np.concatenate((old_src, new_src))
+        dst = np.concatenate((self._indices.astype(np.int64), new_dst))
+        weights = np.concatenate((self._weights, new_weights))
+        added = np.concatenate((np.full(len(old_src), -1), new_order))
+
+        # sort the edges by source and then destination, the insertion order
+        # breaks ties so that the most recently added weight comes last
+        order = np.lexsort((added, dst, src))
+        src, dst, weights = src[order], dst[order], weights[order]
+
+        # keep only the last copy of every repeated edge
+        keep = np.ones(len(src), dtype=bool)
+        keep[:-1] = (src[1:] != src[:-1]) | (dst[1:] != dst[:-1])
+        src, dst, weights = src[keep], dst[keep], weights[keep]
+
+        self._indptr = np.zeros(self.num_vertices + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=self.num_vertices), out=self._indptr[1:])
+        self._indices = dst.astype(np.int32)
+        self._weights = weights
+        self._in_degree = None
+
+    def _has_pending_edges(self):
+        return len(self._pending_src) > 0 or len(self._pending_chunks) > 0
+
+    def _flush_pending_edges(self):
+        """
+        Moves the single edges collected in lists into an array chunk, which
+        keeps them ordered with respect to the chunks added by add_edges
+        """
+        if not self._pending_src:
+            return
+
+        self._pending_chunks.append((np.array(self._pending_src, dtype=np.int64),
+                                     np.array(self._pending_dst, dtype=np.int64),
+                                     np.array(self._pending_weights, dtype=np.float64)))
+
+        self._pending_src = []
+        self._pending_dst = []
+        self._pending_weights = []
+
+    def add_edge(self, v1, v2, weight=1):
+
+        if self.read_only:
+            raise ValueError("Edges cannot be added to a read-only graph")
+
+        # check if the vertices are valid
+        if v1 >= self.num_vertices or v2 >= self.num_vertices or v1 < 0 or v2 < 0:
+            raise ValueError("Vertices %d and %d are out of bounds" % (v1, v2))
+
+        self._check_weight(weight)
+
+        self._pending_src.append(v1)
+        self._pending_dst.append(v2)
+        self._pending_weights.append(weight)
+        self.version += 1
+
+    def add_edges(self, src, dst, weights=None):
+
+        if self.read_only:
+            raise ValueError("Edges cannot be added to a read-only graph")
+
+        src, dst, weights = self._check_edge_arrays(src, dst, weights)
+
+        self._flush_pending_edges()
+        self._pending_chunks.append((src, dst, weights))
+        self.version += 1
+
+    def _edge_positions(self, v1, v2):
+        """
+        :return: the positions in the arrays of the edge between the vertices,
+                 in both directions when the graph is undirected
+        """
+        if self.read_only:
+            raise ValueError("Edges cannot be changed in a read-only graph")
+
+        # check if the vertices are valid
+        if v1 >= self.num_vertices or v2 >= self.num_vertices or v1 < 0 or v2 < 0:
+            raise ValueError("Vertices %d and %d are out of bounds" % (v1, v2))
+
+        position = self._find_edge(v1, v2)
+        if position < 0:
+            raise ValueError("There is no edge between vertices %d and %d" % (v1, v2))
+
+        if self.directed or v1 == v2:
+            return [position]
+
+        return [position, self._find_edge(v2, v1)]
+
+    def _find_edge(self, v1, v2):
+        """
+        :return: the position in the arrays of the edge from v1 to v2, -1 if
+                 there is none
+        """
+        indptr = self.indptr
+        start, end = indptr[v1], indptr[v1 + 1]
+
+        # the neighbours of every vertex are sorted, so binary search for v2
+        position = start + np.searchsorted(self._indices[start:end], v2)
+
+        if position < end and self._indices[position] == v2:
+            return int(position)
+
+        return -1
+
+    def remove_edge(self, v1, v2):
+        positions = self._edge_positions(v1, v2)
+
+        # the arrays are rebuilt without the removed edges, so views handed
+        # out earlier keep the old edges
+        keep = np.ones(len(self._indices), dtype=bool)
+        keep[positions] = False
+
+        src = np.repeat(np.arange(self.num_vertices, dtype=np.int64), np.diff(self._indptr))
+
+        self._indptr = np.zeros(self.num_vertices + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src[keep], minlength=self.num_vertices), out=self._indptr[1:])
+        self._indices = self._indices[keep]
+        self._weights = self._weights[keep]
+        self._in_degree = None
+        self.version += 1
+
+    def update_weight(self, v1, v2, weight):
+        positions = self._edge_positions(v1, v2)
+        self._check_weight(weight)
+
+        # the structure is unchanged, so the weight is written in place
+        self._weights[positions] = weight
+        self.version += 1
+
+    def get_adjacent_vertices(self, v):
+
+        # check if the vertex is valid
+        if v >= self.num_vertices or v < 0:
+            raise ValueError("Vertex %d is out of bounds" % v)
+
+        indptr = self.indptr
+
+        # a view into the indices array, no copy is made
+        return self._indices[indptr[v]:indptr[v + 1]]
+
+    def neighbors_with_weights(self, v):
+
+        # check if the vertex is valid
+        if v >= self.num_vertices or v < 0:
+            raise ValueError("Vertex %d is out of bounds" % v)
+
+        indptr = self.indptr
+        start, end = indptr[v], indptr[v + 1]
+
+        # views into the arrays, no copy is made
+        return self._indices[start:end], self._weights[start:end]
+
+    def edges(self):
+        indptr = self.indptr
+        src = np.repeat(np.arange(self.num_vertices, dtype=np.int64), np.diff(indptr))
+
+        return src, self._indices, self._weights
+
+    def get_in_degree(self, v):
+
+        # check if the vertex is valid
+        if v >= self.num_vertices or v < 0:
+            raise ValueError("Vertex %d is out of bounds" % v)
+
+        if self._in_degree is None or self._has_pending_edges():
+            self._in_degree = np.bincount(self.indices, minlength=self.num_vertices)
+
+        return int(self._in_degree[v])
+
+    def get_edge_weight(self, v1, v2):
+
+        # check if the vertices are valid
+        if v1 >= self.num_vertices or v2 >= self.num_vertices or v1 < 0 or v2 < 0:
+            raise ValueError("Vertices %d and %d are out of bounds" % (v1, v2))
+
+        position = self._find_edge(v1, v2)
+
+        if position >= 0:
+            return self._weights[position]
+
+        return 0
+
+    def gather_edges(self, vertices):
+        """
+        Reads the edges leaving many vertices out of the arrays at once
+
+        :param vertices: array of vertices
+        :return: the src, dst and weights arrays of every edge leaving the
+                 vertices, grouped by vertex in the order given
+        """
+        indptr = self.indptr
+        vertices = np.asarray(vertices, dtype=np.int64)
+
+        starts = indptr[vertices]
+        counts = indptr[vertices + 1] - starts
+
+        # the positions of the edges of a single vertex are consecutive
+        first_position = np.repeat(starts - np.cumsum(counts) + counts, counts)
+        positions = first_position + np.arange(counts.sum())
+
+        return np.repeat(vertices, counts), self._indices[positions], self._weights[positions]
+
+    def to_csr(self):
+        return self
+
+    def reverse(self):
+        """
+        :return: a read-only CSRGraph with the direction of every edge
+                 reversed, the graph itself when it is undirected. It is kept
+                 until the graph changes, so repeated queries do not rebuild it
+        """
+        if not self.directed:
+            return self
+
+        if self._reverse is not None and self._reverse_version == self.version:
+            return self._reverse
+
+        indptr, indices, weights = self.indptr, self.indices, self.weights
+        src = np.repeat(np.arange(self.num_vertices, dtype=np.int32), np.diff(indptr))
+
+        # sort the edges by their end vertex, the start vertices are already
+        # in order so a stable sort keeps them sorted within every end vertex
+        order = np.argsort(indices, kind="stable")
+
+        reverse_indptr = np.zeros(self.num_vertices + 1, dtype=np.int64)
+        np.cumsum(np.bincount(indices, minlength=self.num_vertices), out=reverse_indptr[1:])
+
+        self._reverse = CSRGraph.from_arrays(reverse_indptr, src[order], weights[order], directed=True,
+                                             read_only=True, signed_weights=self.signed_weights)
+        self._reverse_version = self.version
+
+        return self._reverse
+
+    def display(self):
+        for from_vertex in range(self.num_vertices):
+            for to_vertex in self.get_adjacent_vertices(from_vertex):
+                print(from_vertex, "-->", to_vertex)
+
+
+if __name__ == "__main__":
+
+    for graph_class in (AdjacencyMatrixGraph, AdjacencySetGraph, CSRGraph):
+        print(graph_class.__name__)
+
+        g = graph_class(4)
+
+        g.add_edge(0, 1)
+        g.add_edge(0, 2)
+        g.add_edge(2, 3)
+
+        for i in range(4):
+            print("Adjacent to:", i, g.get_adjacent_vertices(i))
+
+        # display the in_degree for each vertex in the graph
+        for i in range(4):
+            print("In degree: ", i, g.get_in_degree(i))
+
+        # display the weight for each edge in the graph
+        for i in range(4):
+            for j in g.get_adjacent_vertices(i):
+                print("Edge weight: ", i, " ", j, "weight: ", g.get_edge_weight(i, j))
+
+        # display the graph
+        g.display()
+
+        # change the weight of one edge and remove another
+        g.update_weight(0, 2, 5)
+        g.remove_edge(2, 3)
+        print("Edge weight after update: ", g.get_edge_weight(0, 2))
+        print("Adjacent to 2 after removal:", g.get_adjacent_vertices(2))
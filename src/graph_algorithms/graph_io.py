@@ -0,0 +1,140 @@
+import os
+import struct
+import tempfile
+import numpy as np
+from .graph import AdjacencyMatrixGraph, CSRGraph
+
+# A graph file starts with a fixed size header followed by the CSR arrays
+# of the graph, every array starting on an 8 byte boundary:
+#
+#   header   magic, version, flags, num_vertices, num_edges (64 bytes)
+#   indptr   num_vertices + 1 little endian int64 offsets
+#   indices  num_edges little endian int32 adjacent vertices
+#   weights  num_edges little endian float64 edge weights
+#
+# num_edges counts the entries of indices, so an undirected edge is
+# counted once in each direction.
+MAGIC = b"GRAPHCSR"
+VERSION = 1
+HEADER = struct.Struct("<8sIIQQ32x")
+
+FLAG_DIRECTED = 1
+FLAG_SIGNED_WEIGHTS = 2
+
+INDPTR_DTYPE = np.dtype("<i8")
+INDICES_DTYPE = np.dtype("<i4")
+WEIGHTS_DTYPE = np.dtype("<f8")
+
+
+def _padding(size):
+    return -size % 8
+
+
+def _array_offsets(num_vertices, num_edges):
+    """
+    :return: byte offsets of the indptr, indices and weights arrays in the file
+    """
+    indptr_offset = HEADER.size
+    indices_offset = indptr_offset + (num_vertices + 1) * INDPTR_DTYPE.itemsize
+
+    weights_offset = indices_offset + num_edges * INDICES_DTYPE.itemsize
+    weights_offset += _padding(weights_offset)
+
+    return indptr_offset, indices_offset, weights_offset
+
+
+def save(graph, path):
+    """
+    Writes a graph to disk in the binary CSR format
+
+    :param graph: graph to save, any backend is converted to CSR first
+    :param path: path of the file to write
+    """
+    csr_graph = graph.to_csr()
+
+    indptr = csr_graph.indptr.astype(INDPTR_DTYPE, copy=False)
+    indices = csr_graph.indices.astype(INDICES_DTYPE, copy=False)
+    weights = csr_graph.weights.astype(WEIGHTS_DTYPE, copy=False)
+
+    flags = 0
+    if csr_graph.directed:
+        flags |= FLAG_DIRECTED
+    if csr_graph.signed_weights:
+        flags |= FLAG_SIGNED_WEIGHTS
+
+    with open(path, "wb") as graph_file:
+        graph_file.write(HEADER.pack(MAGIC, VERSION, flags, csr_graph.num_vertices, len(indices)))
+
+        indptr.tofile(graph_file)
+        indices.tofile(graph_file)
+        graph_file.write(b"\0" * _padding(graph_file.tell()))
+        weights.tofile(graph_file)
+
+
+def _read_array(path, dtype, offset, count, mmap):
+    if not mmap:
+        return np.fromfile(path, dtype=dtype, count=count, offset=offset)
+
+    # an empty region of a file cannot be memory mapped
+    if count == 0:
+        return np.zeros(0, dtype=dtype)
+
+    return np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(count,))
+
+
+def load(path, mmap=True):
+    """
+    Reads a graph written by save.
+
+    With mmap the arrays are memory mapped rather than read, so loading
+    takes the same time whatever the size of the graph and every process
+    loading the same file shares its pages through the page cache. The
+    returned graph is then read-only.
+
+    :param path: path of the file to read
+    :param mmap: True to memory map the file, False to read it into memory
+    :return: a CSRGraph holding the saved edges
+    """
+    with open(path, "rb") as graph_file:
+        header = graph_file.read(HEADER.size)
+
+    if len(header) != HEADER.size:
+        raise ValueError("%s is not a graph file" % path)
+
+    magic, version, flags, num_vertices, num_edges = HEADER.unpack(header)
+
+    if magic != MAGIC:
+        raise ValueError("%s is not a graph file" % path)
+
+    if version != VERSION:
+        raise ValueError("Graph file version %d is not supported" % version)
+
+    indptr_offset, indices_offset, weights_offset = _array_offsets(num_vertices, num_edges)
+
+    indptr = _read_array(path, INDPTR_DTYPE, indptr_offset, num_vertices + 1, mmap)
+    indices = _read_array(path, INDICES_DTYPE, indices_offset, num_edges, mmap)
+    weights = _read_array(path, WEIGHTS_DTYPE, weights_offset, num_edges, mmap)
+
+    return CSRGraph.from_arrays(indptr, indices, weights,
+                                directed=bool(flags & FLAG_DIRECTED), read_only=mmap,
+                                signed_weights=bool(flags & FLAG_SIGNED_WEIGHTS))
+
+
+if __name__ == "__main__":
+
+    # this is an undirected weighted graph
+    g = AdjacencyMatrixGraph(5, directed=False)
+
+    g.add_edge(0, 1, 2)
+    g.add_edge(1, 2, 3)
+    g.add_edge(2, 3, 1)
+    g.add_edge(3, 4, 5)
+
+    graph_path = os.path.join(tempfile.gettempdir(), "graph.bin")
+
+    save(g, graph_path)
+
+    loaded_graph = load(graph_path)
+
+    loaded_graph.display()
+    print("Edge weight: 3 4 weight:", loaded_graph.get_edge_weight(3, 4))
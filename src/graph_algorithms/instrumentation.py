@@ -0,0 +1,194 @@
+import functools
+import time
+
+# the Counters of the active recording, None when nothing is recorded. The
+# instrumented code only checks this for None, once per call or once per
+# vertex, so leaving instrumentation off adds no measurable cost
+active_counters = None
+
+
+class Counters:
+    """
+    The work done by the algorithms run while a recording was active.
+
+    The heap counters cover every priority queue, the priority_dict heaps,
+    the heapq heaps and the buckets of Dial's algorithm. An entry skipped
+    because its vertex was already settled or found a shorter path is a
+    stale skip. Edges relaxed counts the edges examined from every settled
+    vertex, or every edge considered by Kruskal's algorithm.
+    """
+    FIELDS = ("heap_pushes", "heap_pops", "heap_rebuilds", "stale_skips", "edges_relaxed", "vertices_settled")
+
+    def __init__(self):
+        self.heap_pushes = 0
+        self.heap_pops = 0
+        self.heap_rebuilds = 0
+        self.stale_skips = 0
+        self.edges_relaxed = 0
+        self.vertices_settled = 0
+
+        # phase name -> total wall time in seconds spent in the phase
+        self.phase_times = {}
+
+    def add(self, other):
+        """
+        Adds the counts and phase times of another Counters to these
+        """
+        for field in self.FIELDS:
+            setattr(self, field, getattr(self, field) + getattr(other, field))
+
+        for name, seconds in other.phase_times.items():
+            self.phase_times[name] = self.phase_times.get(name, 0.0) + seconds
+
+    def as_dict(self):
+        """
+        :return: dict of every count and of the phase times
+        """
+        counts = {field: getattr(self, field) for field in self.FIELDS}
+        counts["phase_times"] = dict(self.phase_times)
+
+        return counts
+
+    def __repr__(self):
+        return "Counters(%s)" % ", ".join("%s=%r" % item for item in self.as_dict().items())
+
+
+class recording:
+    """
+    Context manager recording the work of the algorithms run inside it.
+    A recording inside another one adds its counts to the outer recording
+    when it ends::
+
+        with instrumentation.recording() as counters:
+            dijkstra.build_distance_table(g, 0)
+
+        print(counters.as_dict())
+    """
+    def __init__(self, callback=None):
+        """
+        :param callback: optional function called with the Counters when the
+                         recording ends
+        """
+        self.counters = Counters()
+        self.callback = callback
+        self._previous = None
+
+    def __enter__(self):
+        global active_counters
+
+        self._previous = active_counters
+        active_counters = self.counters
+
+        return self.counters
+
+    def __exit__(self, *exc_info):
+        global active_counters
+
+        active_counters = self._previous
+
+        if self._previous is not None:
+            self._previous.add(self.counters)
+
+        if self.callback is not None:
+            self.callback(self.counters)
+
+        return False
+
+
+class _Phase:
+    __slots__ = ("counters", "name", "start")
+
+    def __init__(self, counters, name):
+        self.counters = counters
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.start
+        phase_times = self.counters.phase_times
+        phase_times[self.name] = phase_times.get(self.name, 0.0) + elapsed
+
+        return False
+
+
+class _NoPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NO_PHASE = _NoPhase()
+
+
+def phase(name):
+    """
+    :param name: name of the phase, such as "dijkstra.search"
+    :return: context manager adding the wall time spent inside it to the
+             phase, which does nothing when no recording is active
+    """
+    if active_counters is None:
+        return _NO_PHASE
+
+    return _Phase(active_counters, name)
+
+
+def timed(name):
+    """
+    :param name: name of the phase
+    :return: decorator adding the wall time of every call of the function to
+             the phase while a recording is active
+    """
+    def decorator(function):
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if active_counters is None:
+                return function(*args, **kwargs)
+
+            with _Phase(active_counters, name):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+if __name__ == "__main__":
+
+    # run as a script this file is not the module the algorithms record to
+    from . import instrumentation
+    from .dijkstra import build_distance_table, single_source_dijkstra
+    from .graph import CSRGraph
+    from .kruskal import minimum_spanning_tree
+    from .shortest_path import build_dist_table
+
+    # this is an undirected weighted graph
+    g = CSRGraph(9, directed=False)
+
+    g.add_edge(0, 1, 1)
+    g.add_edge(1, 2, 2)
+    g.add_edge(1, 3, 6)
+    g.add_edge(2, 3, 2)
+    g.add_edge(1, 4, 3)
+    g.add_edge(3, 5, 1)
+    g.add_edge(5, 4, 5)
+    g.add_edge(3, 6, 1)
+    g.add_edge(6, 7, 1)
+    g.add_edge(0, 7, 8)
+    g.add_edge(7, 8, 2)
+
+    for name, function in (("build_distance_table", lambda: build_distance_table(g, 0, max_bucket_weight=None)),
+                           ("dial", lambda: build_distance_table(g, 0)),
+                           ("single_source_dijkstra", lambda: single_source_dijkstra(g, 0)),
+                           ("breadth first search", lambda: build_dist_table(g, 0)),
+                           ("kruskal", lambda: minimum_spanning_tree(g))):
+        with instrumentation.recording() as counters:
+            function()
+
+        print(name, counters)
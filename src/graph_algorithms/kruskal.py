@@ -0,0 +1,140 @@
+import numpy as np
+from . import instrumentation
+from .disjoint_set import DisjointSet
+from .graph import AdjacencyMatrixGraph
+
+
+def sorted_edges(graph):
+    """
+    :return: the src, dst and weights arrays of every edge in the graph
+             sorted by weight, each undirected edge appears once
+    """
+    src, dst, weights = graph.edges()
+    src, dst = src.astype(np.int64), dst.astype(np.int64)
+
+    # an undirected edge is stored in both directions, keep one of them
+    if not graph.directed:
+        keep = src < dst
+        src, dst, weights = src[keep], dst[keep], weights[keep]
+
+    order = np.argsort(weights, kind="stable")
+
+    return src[order], dst[order], weights[order]
+
+
+@instrumentation.timed("kruskal")
+def _kruskal(graph):
+    """
+    Kruskal's algorithm, takes the edges in order of weight and keeps every
+    edge which joins two trees of the forest built so far
+
+    :return: array with the two vertices of every edge of the forest in a
+             row, and the DisjointSet of the trees of the forest
+    """
+    with instrumentation.phase("kruskal.sort_edges"):
+        src, dst, _ = sorted_edges(graph)
+
+    # the trees of the forest built so far
+    forest = DisjointSet(graph.num_vertices)
+
+    spanning_forest = []
+    num_examined = len(src)
+
+    for position, (v1, v2) in enumerate(zip(src.tolist(), dst.tolist())):
+
+        # an edge within a single tree would create a cycle
+        if forest.union(v1, v2):
+            spanning_forest.append((v1, v2))
+
+            # every vertex is in a single tree
+            if forest.num_sets == 1:
+                num_examined = position + 1
+                break
+
+    counters = instrumentation.active_counters
+    if counters is not None:
+        counters.edges_relaxed += num_examined
+
+    return np.array(spanning_forest, dtype=np.int64).reshape(-1, 2), forest
+
+
+def split_forest(forest_edges, labels):
+    """
+    :param forest_edges: array with the two vertices of every edge of a forest in a row
+    :param labels: array holding the same label for every vertex of a tree
+    :return: list holding an array of the edges of every tree, ordered by the
+             lowest vertex of the tree. A vertex without edges is a tree
+             with no edges.
+    """
+    _, first_vertex, tree_of_vertex = np.unique(labels, return_index=True, return_inverse=True)
+
+    # number the trees in order of their lowest vertex
+    tree_order = np.argsort(first_vertex, kind="stable")
+    tree_rank = np.empty_like(tree_order)
+    tree_rank[tree_order] = np.arange(len(tree_order))
+
+    tree_of_edge = tree_rank[tree_of_vertex[forest_edges[:, 0]]]
+    order = np.argsort(tree_of_edge, kind="stable")
+    boundaries = np.searchsorted(tree_of_edge[order], np.arange(1, len(tree_order)))
+
+    return np.split(forest_edges[order], boundaries)
+
+
+def minimum_spanning_tree(graph):
+    """
+    :param graph: connected graph
+    :return: array with the two vertices of every edge of the tree in a row
+    """
+    spanning_tree, forest = _kruskal(graph)
+
+    if forest.num_sets > 1:
+        raise ValueError("Minimum Spanning Tree not found, the graph is not connected")
+
+    return spanning_tree
+
+
+def minimum_spanning_forest(graph):
+    """
+    :param graph: graph which need not be connected
+    :return: list holding the minimum spanning tree of every connected
+             component, as described in split_forest
+    """
+    spanning_forest, forest = _kruskal(graph)
+
+    return split_forest(spanning_forest, forest.labels())
+
+
+if __name__ == "__main__":
+
+    # this is an undirected unweighted graph
+    g = AdjacencyMatrixGraph(8, directed=False)
+
+    # add the edges to the graph
+    g.add_edge(0, 1, 1)
+    g.add_edge(1, 2, 2)
+    g.add_edge(1, 3, 2)
+    g.add_edge(2, 3, 2)
+    g.add_edge(1, 4, 3)
+    g.add_edge(3, 5, 1)
+    g.add_edge(5, 4, 2)
+    g.add_edge(3, 6, 1)
+    g.add_edge(6, 7, 1)
+    g.add_edge(7, 0, 1)
+
+    print("Minimum Spanning Tree")
+    for v1, v2 in minimum_spanning_tree(g):
+        print(v1, " --> ", v2)
+
+    # this undirected graph has three connected components
+    h = AdjacencyMatrixGraph(8, directed=False)
+
+    h.add_edge(0, 1, 1)
+    h.add_edge(1, 2, 2)
+    h.add_edge(2, 0, 3)
+    h.add_edge(3, 4, 1)
+    h.add_edge(4, 5, 2)
+    h.add_edge(6, 7, 1)
+
+    print("Minimum Spanning Forest")
+    for tree in minimum_spanning_forest(h):
+        print([(int(v1), int(v2)) for v1, v2 in tree])
@@ -0,0 +1,143 @@
+import collections
+import concurrent.futures
+import os
+import shutil
+import tempfile
+import numpy as np
+from . import graph_io
+from .dijkstra import single_source_dijkstra
+from .shortest_path import frontier_bfs
+from .graph import AdjacencyMatrixGraph
+
+# the graph every worker process searches, memory mapped from a file
+# shared by all the workers on the host
+_worker_graph = None
+
+
+def _init_worker(graph_path):
+    global _worker_graph
+    _worker_graph = graph_io.load(graph_path, mmap=True)
+
+
+def distance_rows(graph, sources, unweighted=False):
+    """
+    :param graph: graph to search
+    :param sources: sequence of vertices the searches start from
+    :param unweighted: True to count edges with a breadth first search,
+                       False to add up edge weights with Dijkstra's algorithm
+    :return: array holding the distances from every source in a row,
+             unreachable vertices are at an infinite distance
+    """
+    rows = np.empty((len(sources), graph.num_vertices))
+
+    for row, source in enumerate(sources):
+        if unweighted:
+            levels, _ = frontier_bfs(graph, source)
+            rows[row] = np.where(levels < 0, np.inf, levels)
+        else:
+            rows[row] = single_source_dijkstra(graph, source).distances
+
+    return rows
+
+
+def _distance_rows_task(sources, unweighted):
+    return distance_rows(_worker_graph, sources, unweighted)
+
+
+def iter_distance_blocks(graph, sources, unweighted=False, processes=None, block_size=64):
+    """
+    Computes the distances from many sources, block_size sources at a time.
+
+    With more than one process the blocks are spread over a process pool.
+    The graph is saved once to a temporary file which every worker memory
+    maps, so it is neither pickled for every task nor copied into every
+    worker. Only a few blocks are in flight at once, so a consumer writing
+    the blocks out keeps memory bounded whatever the number of sources.
+
+    :param graph: graph to search
+    :param sources: sequence of vertices the searches start from
+    :param unweighted: True to count edges, False to add up edge weights
+    :param processes: number of worker processes, the work is done in this
+                      process if None or 1
+    :param block_size: number of sources searched by one task
+    :return: generator of (first row, block of rows) in order of the sources
+    """
+    sources = np.asarray(sources, dtype=np.int64)
+    blocks = [sources[start:start + block_size] for start in range(0, len(sources), block_size)]
+
+    if processes is None or processes <= 1:
+        start = 0
+        for block in blocks:
+            yield start, distance_rows(graph, block.tolist(), unweighted)
+            start += len(block)
+        return
+
+    graph_dir = tempfile.mkdtemp()
+    graph_path = os.path.join(graph_dir, "graph.bin")
+
+    try:
+        graph_io.save(graph, graph_path)
+
+        with concurrent.futures.ProcessPoolExecutor(processes, initializer=_init_worker,
+                                                    initargs=(graph_path,)) as executor:
+            pending = collections.deque()
+            start = 0
+
+            for block in blocks:
+                pending.append((start, executor.submit(_distance_rows_task, block.tolist(), unweighted)))
+                start += len(block)
+
+                # keep every worker busy without queuing up all the results
+                if len(pending) >= 2 * processes:
+                    block_start, task = pending.popleft()
+                    yield block_start, task.result()
+
+            while pending:
+                block_start, task = pending.popleft()
+                yield block_start, task.result()
+    finally:
+        shutil.rmtree(graph_dir, ignore_errors=True)
+
+
+def distance_matrix(graph, sources, unweighted=False, processes=None, block_size=64, out=None):
+    """
+    :param graph: graph to search
+    :param sources: sequence of vertices the searches start from
+    :param unweighted: True to count edges, False to add up edge weights
+    :param processes: number of worker processes, see iter_distance_blocks
+    :param block_size: number of sources searched by one task
+    :param out: path of a .npy file the rows are written to as they are
+                computed, for results which do not fit in memory
+    :return: array holding the distances from every source in a row, memory
+             mapped from out when it is given
+    """
+    shape = (len(sources), graph.num_vertices)
+
+    if out is None:
+        distances = np.empty(shape)
+    else:
+        distances = np.lib.format.open_memmap(out, mode="w+", dtype=np.float64, shape=shape)
+
+    for start, rows in iter_distance_blocks(graph, sources, unweighted, processes, block_size):
+        distances[start:start + len(rows)] = rows
+
+    if out is not None:
+        distances.flush()
+
+    return distances
+
+
+if __name__ == "__main__":
+
+    # this is an undirected weighted graph
+    g = AdjacencyMatrixGraph(6, directed=False)
+
+    g.add_edge(0, 1, 1)
+    g.add_edge(1, 2, 2)
+    g.add_edge(2, 3, 1)
+    g.add_edge(3, 4, 3)
+    g.add_edge(4, 5, 1)
+    g.add_edge(5, 0, 4)
+
+    print(distance_matrix(g, range(6), processes=2, block_size=2))
+    print(distance_matrix(g, range(6), unweighted=True))
@@ -0,0 +1,166 @@
+from collections import OrderedDict
+import numpy as np
+from .dijkstra import ShortestPathResult, single_source_dijkstra
+from .graph import CSRGraph
+
+
+class ShortestPathCache:
+    """
+    Remembers the single source shortest path results of a graph, so that
+    queries from the same source are answered without searching again.
+
+    Results are keyed by the version of the graph and the source vertex.
+    Once the graph has been changed every stored result is stale and is
+    dropped on the next lookup. When the stored results would take more
+    than max_bytes the least recently used ones are evicted.
+
+    Results are stored with 32 bit predecessors where the graph is small
+    enough, and their arrays are read-only as they are shared between
+    every caller asking for the same source.
+    """
+    def __init__(self, graph, max_bytes=64 * 1024 * 1024, solver=single_source_dijkstra):
+        """
+        :param graph: graph whose shortest paths are cached
+        :param max_bytes: most memory the arrays of the stored results may take
+        :param solver: function of the graph and a source vertex returning
+                       a ShortestPathResult
+        """
+        if max_bytes < 0:
+            raise ValueError("The memory budget cannot be negative")
+
+        self.graph = graph
+        self.max_bytes = max_bytes
+        self.solver = solver
+
+        # source vertex -> result, from the least to the most recently used
+        self._results = OrderedDict()
+        self._version = graph.version
+        self.nbytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self):
+        self._check_version()
+        return len(self._results)
+
+    def __contains__(self, source):
+        self._check_version()
+        return source in self._results
+
+    def _check_version(self):
+        if self.graph.version != self._version:
+            self.invalidations += len(self._results)
+            self._results.clear()
+            self.nbytes = 0
+            self._version = self.graph.version
+
+    def _compact(self, result):
+        predecessors = result.predecessors
+        if self.graph.num_vertices <= np.iinfo(np.int32).max:
+            predecessors = predecessors.astype(np.int32)
+        else:
+            predecessors = predecessors.copy()
+
+        distances = np.array(result.distances)
+
+        distances.flags.writeable = False
+        predecessors.flags.writeable = False
+
+        settled = None
+        if result.settled is not None:
+            settled = result.settled.copy()
+            settled.flags.writeable = False
+
+        return ShortestPathResult(result.source, distances, predecessors, result.num_settled, settled)
+
+    def get(self, source):
+        """
+        :param source: vertex the shortest paths start from
+        :return: ShortestPathResult from the source, searched for only if it
+                 is not already stored for the current version of the graph
+        """
+        if source >= self.graph.num_vertices or source < 0:
+            raise ValueError("Vertex %d is out of bounds" % source)
+
+        self._check_version()
+
+        result = self._results.get(source)
+        if result is not None:
+            self._results.move_to_end(source)
+            self.hits += 1
+            return result
+
+        self.misses += 1
+        result = self._compact(self.solver(self.graph, source))
+
+        size = result.distances.nbytes + result.predecessors.nbytes
+
+        # a result larger than the whole budget is returned but not stored
+        if size <= self.max_bytes:
+            while self.nbytes + size > self.max_bytes:
+                _, evicted = self._results.popitem(last=False)
+                self.nbytes -= evicted.distances.nbytes + evicted.predecessors.nbytes
+                self.evictions += 1
+
+            self._results[source] = result
+            self.nbytes += size
+
+        return result
+
+    def clear(self):
+        """
+        Drops every stored result, the statistics are kept
+        """
+        self._results.clear()
+        self.nbytes = 0
+
+    def stats(self):
+        """
+        :return: dict of the number of hits, misses, evictions and
+                 invalidations so far, the hit rate, and the number and
+                 size of the stored results
+        """
+        self._check_version()
+
+        lookups = self.hits + self.misses
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "entries": len(self._results),
+            "nbytes": self.nbytes,
+        }
+
+
+if __name__ == "__main__":
+
+    # this is an undirected weighted graph
+    g = CSRGraph(9, directed=False)
+
+    g.add_edge(0, 1, 1)
+    g.add_edge(1, 2, 2)
+    g.add_edge(1, 3, 6)
+    g.add_edge(2, 3, 2)
+    g.add_edge(1, 4, 3)
+    g.add_edge(3, 5, 1)
+    g.add_edge(5, 4, 5)
+    g.add_edge(3, 6, 1)
+    g.add_edge(6, 7, 1)
+    g.add_edge(0, 7, 8)
+
+    cache = ShortestPathCache(g)
+
+    print("Shortest Path from 0 to 6: ", cache.get(0).path_to(6))
+    print("Shortest Path from 0 to 5: ", cache.get(0).path_to(5))
+
+    # the new edge makes the stored result from 0 stale
+    g.add_edge(0, 6, 1)
+    print("Shortest Path from 0 to 5: ", cache.get(0).path_to(5))
+
+    print(cache.stats())
@@ -1,8 +1,10 @@
-import priority_dict as pq
-from graph import *
+from . import instrumentation
+from . import priority_dict as pq
+from .graph import AdjacencyMatrixGraph
 
 
-def minimum_spanning_tree(graph, source):
+@instrumentation.timed("prim.minimum_spanning_tree")
+def minimum_spanning_tree(graph, source, arity=4):
 
     # A dictionary mapping the vertex ID to a tuple
     # of (distance from source, last vertex on path from source)
@@ -15,8 +17,9 @@ def minimum_spanning_tree(graph, source):
     distance_table[source] = (0, source)
 
     # Holds the mapping of vertex ID to distance from source vertex
-    # Access the highest priority (lowest distance) item first
-    priority_queue = pq.priority_dict()
+    # Access the highest priority (lowest distance) item first. The heap
+    # moves an entry when its distance drops instead of keeping stale copies
+    priority_queue = pq.indexed_priority_dict(arity=arity)
 
     priority_queue[source] = 0
 
@@ -27,12 +30,16 @@ def minimum_spanning_tree(graph, source):
     # "1->2" is an edge between vertices 1 and 2
     spanning_tree = set()
 
+    counters = instrumentation.active_counters
+
     while len(priority_queue.keys()) > 0:
         current_vertex = priority_queue.pop_smallest()
 
         # if we've visited a vertex then we have all the outbound
         # edges from it, we do not process it again
         if current_vertex in is_visited:
+            if counters is not None:
+                counters.stale_skips += 1
             continue
 
         is_visited.add(current_vertex)
@@ -49,10 +56,14 @@ def minimum_spanning_tree(graph, source):
             if edge not in spanning_tree:
                 spanning_tree.add(edge)
 
-        for neighbour in graph.get_adjacent_vertices(current_vertex):
+        neighbours, weights = graph.neighbors_with_weights(current_vertex)
+
+        if counters is not None:
+            counters.vertices_settled += 1
+            counters.edges_relaxed += len(neighbours)
 
-            # The distance to the neighbour is only the weight of the edge connecting to the neighbour
-            distance = g.get_edge_weight(current_vertex, neighbour)
+        # The distance to the neighbour is only the weight of the edge connecting to the neighbour
+        for neighbour, distance in zip(neighbours.tolist(), weights.tolist()):
 
             # The last recorded distance to this neighbour from the source
             neighbour_distance = distance_table[neighbour][0]
@@ -72,20 +83,22 @@ def minimum_spanning_tree(graph, source):
         print(edge)
 
 
-# this is an undirected unweighted graph
-g = AdjacencyMatrixGraph(9, directed=False)
+if __name__ == "__main__":
+
+    # this is an undirected unweighted graph
+    g = AdjacencyMatrixGraph(9, directed=False)
 
-# add the edges to the graph
-g.add_edge(0, 1, 1)
-g.add_edge(1, 2, 2)
-g.add_edge(1, 3, 2)
-g.add_edge(2, 3, 2)
-g.add_edge(1, 4, 3)
-g.add_edge(3, 5, 1)
-g.add_edge(5, 4, 3)
-g.add_edge(3, 6, 1)
-g.add_edge(6, 7, 1)
-g.add_edge(7, 0, 1)
+    # add the edges to the graph
+    g.add_edge(0, 1, 1)
+    g.add_edge(1, 2, 2)
+    g.add_edge(1, 3, 2)
+    g.add_edge(2, 3, 2)
+    g.add_edge(1, 4, 3)
+    g.add_edge(3, 5, 1)
+    g.add_edge(5, 4, 3)
+    g.add_edge(3, 6, 1)
+    g.add_edge(6, 7, 1)
+    g.add_edge(7, 0, 1)
 
-minimum_spanning_tree(g, 1)
-minimum_spanning_tree(g, 3)
+    minimum_spanning_tree(g, 1)
+    minimum_spanning_tree(g, 3)
@@ -0,0 +1,307 @@
+from heapq import heapify, heappush, heappop
+from . import instrumentation
+
+
+class priority_dict(dict):
+    """Dictionary that can be used as a priority queue.
+
+    Keys of the dictionary are items to be put into the queue, and values
+    are their respective priorities. All dictionary methods work as expected.
+    The advantage over a standard heapq-based priority queue is
+    that priorities of items can be efficiently updated (amortized O(1))
+    using code as 'thedict[item] = new_priority.'
+
+    The 'smallest' method can be used to return the object with lowest
+    priority, and 'pop_smallest' also removes it.
+
+    The 'sorted_iter' method provides a destructive sorted iterator.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(priority_dict, self).__init__(*args, **kwargs)
+        self._rebuild_heap()
+
+    def _rebuild_heap(self):
+        self._heap = [(v, k) for k, v in self.items()]
+        heapify(self._heap)
+
+        counters = instrumentation.active_counters
+        if counters is not None and self._heap:
+            counters.heap_rebuilds += 1
+
+    def smallest(self):
+        """Return the item with the lowest priority.
+
+        Raises IndexError if the object is empty.
+        """
+
+        heap = self._heap
+        v, k = heap[0]
+        while k not in self or self[k] != v:
+            heappop(heap)
+            v, k = heap[0]
+
+            counters = instrumentation.active_counters
+            if counters is not None:
+                counters.heap_pops += 1
+                counters.stale_skips += 1
+        return k
+
+    def pop_smallest(self):
+        """Return the item with the lowest priority and remove it.
+
+        Raises IndexError if the object is empty.
+        """
+
+        heap = self._heap
+        v, k = heappop(heap)
+        num_stale = 0
+        while k not in self or self[k] != v:
+            v, k = heappop(heap)
+            num_stale += 1
+        del self[k]
+
+        counters = instrumentation.active_counters
+        if counters is not None:
+            counters.heap_pops += num_stale + 1
+            counters.stale_skips += num_stale
+        return k
+
+    def __setitem__(self, key, val):
+        # We are not going to remove the previous value from the heap,
+        # since this would have a cost O(n).
+
+        super(priority_dict, self).__setitem__(key, val)
+
+        if len(self._heap) < 2 * len(self):
+            heappush(self._heap, (val, key))
+
+            counters = instrumentation.active_counters
+            if counters is not None:
+                counters.heap_pushes += 1
+        else:
+            # When the heap grows larger than 2 * len(self), we rebuild it
+            # from scratch to avoid wasting too much memory.
+            self._rebuild_heap()
+
+    def setdefault(self, key, val):
+        if key not in self:
+            self[key] = val
+            return val
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        # Reimplementing dict.update is tricky -- see e.g.
+        # http://mail.python.org/pipermail/python-ideas/2007-May/000744.html
+        # We just rebuild the heap from scratch after passing to super.
+
+        super(priority_dict, self).update(*args, **kwargs)
+        self._rebuild_heap()
+
+    def sorted_iter(self):
+        """Sorted iterator of the priority dictionary items.
+
+        Beware: this will destroy elements as they are returned.
+        """
+
+        while self:
+            yield self.pop_smallest()
+
+
+class indexed_priority_dict(dict):
+    """Dictionary that can be used as a priority queue, backed by an
+    indexed d-ary heap.
+
+    Keys of the dictionary are items to be put into the queue, and values
+    are their respective priorities, exactly as with priority_dict. Rather
+    than leaving stale entries behind when a priority changes, the heap
+    keeps the position of every key, so an update moves the existing
+    entry in O(log n) and the heap never holds more than len(self) items.
+
+    The arity is the number of children of every heap node. A wider heap
+    is shallower, which makes updates cheaper at the cost of comparing
+    more children when the smallest item is removed.
+    """
+
+    def __init__(self, *args, arity=4, **kwargs):
+        if arity < 2:
+            raise ValueError("A heap must have an arity of at least 2")
+
+        self._arity = arity
+        super(indexed_priority_dict, self).__init__(*args, **kwargs)
+        self._rebuild_heap()
+
+    def _rebuild_heap(self):
+        # the keys in heap order, the priority of every heap entry and
+        # the heap index of every key
+        self._heap = list(self.keys())
+        self._priorities = list(self.values())
+        self._position = {k: i for i, k in enumerate(self._heap)}
+
+        for i in reversed(range((len(self._heap) - 2) // self._arity + 1)):
+            self._sift_down(i)
+
+        counters = instrumentation.active_counters
+        if counters is not None and self._heap:
+            counters.heap_rebuilds += 1
+
+    def _move(self, key, priority, i):
+        self._heap[i] = key
+        self._priorities[i] = priority
+        self._position[key] = i
+
+    def _sift_up(self, i):
+        heap, priorities, arity = self._heap, self._priorities, self._arity
+        key, priority = heap[i], priorities[i]
+
+        while i > 0:
+            parent = (i - 1) // arity
+            if priorities[parent] <= priority:
+                break
+            self._move(heap[parent], priorities[parent], i)
+            i = parent
+
+        self._move(key, priority, i)
+
+    def _sift_down(self, i):
+        heap, priorities, arity = self._heap, self._priorities, self._arity
+        key, priority = heap[i], priorities[i]
+        size = len(heap)
+
+        while True:
+            first_child = arity * i + 1
+            if first_child >= size:
+                break
+
+            # the child with the lowest priority
+            child = first_child
+            for c in range(first_child + 1, min(first_child + arity, size)):
+                if priorities[c] < priorities[child]:
+                    child = c
+
+            if priorities[child] >= priority:
+                break
+            self._move(heap[child], priorities[child], i)
+            i = child
+
+        self._move(key, priority, i)
+
+    def _remove_at(self, i):
+        """Remove the heap entry at index i, filling the gap with the last entry."""
+
+        heap, priorities = self._heap, self._priorities
+        del self._position[heap[i]]
+
+        last_key, last_priority = heap.pop(), priorities.pop()
+        if i == len(heap):
+            return
+
+        old_priority = priorities[i]
+        self._move(last_key, last_priority, i)
+        if last_priority < old_priority:
+            self._sift_up(i)
+        else:
+            self._sift_down(i)
+
+    def smallest(self):
+        """Return the item with the lowest priority.
+
+        Raises IndexError if the object is empty.
+        """
+
+        return self._heap[0]
+
+    def pop_smallest(self):
+        """Return the item with the lowest priority and remove it.
+
+        Raises IndexError if the object is empty.
+        """
+
+        k = self._heap[0]
+        self._remove_at(0)
+        super(indexed_priority_dict, self).__delitem__(k)
+
+        counters = instrumentation.active_counters
+        if counters is not None:
+            counters.heap_pops += 1
+        return k
+
+    def decrease_key(self, key, val):
+        """Lower the priority of an item already in the queue.
+
+        Raises KeyError if the item is missing and ValueError if the new
+        priority is higher than the current one.
+        """
+
+        if val > self[key]:
+            raise ValueError("The new priority is higher than the current priority")
+
+        self[key] = val
+
+    def __setitem__(self, key, val):
+        position = self._position.get(key)
+        super(indexed_priority_dict, self).__setitem__(key, val)
+
+        # an entry moved to a new priority counts as a push, as it would
+        # be with a heap keeping stale entries
+        counters = instrumentation.active_counters
+        if counters is not None:
+            counters.heap_pushes += 1
+
+        if position is None:
+            self._heap.append(key)
+            self._priorities.append(val)
+            self._position[key] = len(self._heap) - 1
+            self._sift_up(len(self._heap) - 1)
+            return
+
+        old_priority = self._priorities[position]
+        self._priorities[position] = val
+        if val < old_priority:
+            self._sift_up(position)
+        else:
+            self._sift_down(position)
+
+    def __delitem__(self, key):
+        super(indexed_priority_dict, self).__delitem__(key)
+        self._remove_at(self._position[key])
+
+    def pop(self, key, *default):
+        if key not in self:
+            return super(indexed_priority_dict, self).pop(key, *default)
+
+        val = self[key]
+        del self[key]
+        return val
+
+    def popitem(self):
+        if not self:
+            raise KeyError("popitem(): dictionary is empty")
+
+        val = self._priorities[len(self._heap) - 1]
+        key = self._heap[-1]
+        del self[key]
+        return key, val
+
+    def clear(self):
+        super(indexed_priority_dict, self).clear()
+        self._rebuild_heap()
+
+    def setdefault(self, key, val):
+        if key not in self:
+            self[key] = val
+            return val
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        super(indexed_priority_dict, self).update(*args, **kwargs)
+        self._rebuild_heap()
+
+    def sorted_iter(self):
+        """Sorted iterator of the priority dictionary items.
+
+        Beware: this will destroy elements as they are returned.
+        """
+
+        while self:
+            yield self.pop_smallest()
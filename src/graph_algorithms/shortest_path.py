@@ -0,0 +1,202 @@
+from collections import deque
+import numpy as np
+from . import instrumentation
+from .dijkstra import ShortestPathResult
+from .graph import AdjacencyMatrixGraph
+
+
+@instrumentation.timed("shortest_path.build_dist_table")
+def build_dist_table(graph, source):
+
+    # A dictionary mapping the vertex ID to a tuple
+    # of (distance from source, last vertex on path from source)
+    distance_table = {}
+
+    for v_id in range(graph.num_vertices):
+        distance_table[v_id] = (None, None)
+
+    # The distance from the source node to itself is 0
+    distance_table[source] = (0, source)
+
+    queue = deque([source])
+
+    counters = instrumentation.active_counters
+
+    while queue:
+        current_vertex = queue.popleft()
+
+        # the distance of the current vertex from the source
+        current_dist = distance_table[current_vertex][0]
+
+        neighbours = graph.get_adjacent_vertices(current_vertex)
+
+        if counters is not None:
+            counters.vertices_settled += 1
+            counters.edges_relaxed += len(neighbours)
+
+        for neighbour in neighbours:
+            # Only update the distance table if no current distance from
+            # the source is set
+            if distance_table[neighbour][0] is None:
+                distance_table[neighbour] = (current_dist + 1, current_vertex)
+                queue.append(neighbour)
+
+    return distance_table
+
+
+@instrumentation.timed("shortest_path.frontier_bfs")
+def frontier_bfs(graph, source, alpha=14, beta=24):
+    """
+    Breadth first search which expands a whole level at a time with array
+    operations over the CSR arrays of the graph.
+
+    Following Beamer's direction optimizing BFS, a level is expanded top
+    down, from the frontier to its unvisited neighbours, while the frontier
+    is small, and bottom up, from the unvisited vertices to any neighbour in
+    the frontier, once the edges leaving the frontier outnumber a fraction
+    of the edges still unexplored. On low diameter graphs most vertices are
+    found in a few large levels where bottom up expansion looks at far fewer
+    edges.
+
+    :param graph: graph to search, edge weights are ignored
+    :param source: vertex the search starts from
+    :param alpha: switch to bottom up once the frontier has more than
+                  1 / alpha of the unexplored edges
+    :param beta: switch back to top down once the frontier has fewer than
+                 1 / beta of the vertices
+    :return: array of the number of edges between the source and every
+             vertex, and array of the last vertex on a shortest path to every
+             vertex. Both hold -1 for unreached vertices
+    """
+    csr_graph = graph.to_csr()
+    reverse_graph = csr_graph.reverse()
+
+    degrees = np.diff(csr_graph.indptr)
+
+    levels = np.full(graph.num_vertices, -1, dtype=np.int32)
+    parents = np.full(graph.num_vertices, -1, dtype=np.int64)
+
+    levels[source] = 0
+    parents[source] = source
+
+    frontier = np.array([source], dtype=np.int64)
+    unexplored_edges = degrees.sum() - degrees[source]
+    bottom_up = False
+    level = 0
+
+    counters = instrumentation.active_counters
+
+    while len(frontier) > 0:
+        frontier_edges = degrees[frontier].sum()
+
+        if not bottom_up and frontier_edges > unexplored_edges / alpha:
+            bottom_up = True
+        elif bottom_up and len(frontier) < graph.num_vertices / beta:
+            bottom_up = False
+
+        level += 1
+
+        if bottom_up:
+            in_frontier = np.zeros(graph.num_vertices, dtype=bool)
+            in_frontier[frontier] = True
+
+            # every unvisited vertex looks for a neighbour in the frontier
+            unvisited = np.flatnonzero(levels < 0)
+            children, candidates, _ = reverse_graph.gather_edges(unvisited)
+
+            found = in_frontier[candidates]
+            children, candidates = children[found], candidates[found]
+
+            next_frontier, first = np.unique(children, return_index=True)
+            parents[next_frontier] = candidates[first]
+        else:
+            # every vertex in the frontier offers its unvisited neighbours
+            candidates, children, _ = csr_graph.gather_edges(frontier)
+
+            found = levels[children] < 0
+            candidates, children = candidates[found], children[found]
+
+            next_frontier, first = np.unique(children, return_index=True)
+            parents[next_frontier] = candidates[first]
+
+        levels[next_frontier] = level
+        unexplored_edges -= degrees[next_frontier].sum()
+
+        if counters is not None:
+            counters.vertices_settled += len(frontier)
+            counters.edges_relaxed += len(found)
+        frontier = next_frontier.astype(np.int64)
+
+    return levels, parents
+
+
+def breadth_first_result(graph, source):
+    """
+    :return: ShortestPathResult holding the number of edges on the shortest
+             path to every vertex, found by frontier_bfs. Suits the solver
+             of a ShortestPathCache of unweighted paths
+    """
+    levels, parents = frontier_bfs(graph, source)
+
+    distances = levels.astype(np.float64)
+    distances[levels < 0] = np.inf
+
+    return ShortestPathResult(source, distances, parents, int(np.count_nonzero(levels >= 0)))
+
+
+def shortest_path(graph, source, destination, cache=None):
+    """
+    :param cache: optional ShortestPathCache of the graph built with
+                  breadth_first_result as its solver, which answers repeated
+                  queries from the same source without searching
+    """
+    if cache is not None:
+        if cache.graph is not graph:
+            raise ValueError("The cache holds the shortest paths of another graph")
+
+        path = cache.get(source).path_to(destination)
+
+        if path is None:
+            print("There is no path from %d to %d" % (source, destination))
+        else:
+            print("Shortest Path is: ", path)
+        return
+
+    distance_table = build_dist_table(graph, source)
+
+    path = [destination]
+
+    preceding_vertex = distance_table[destination][1]
+
+    while preceding_vertex is not None and preceding_vertex is not source:
+
+        path.insert(0, preceding_vertex)
+        preceding_vertex = distance_table[preceding_vertex][1]
+
+    if preceding_vertex is None:
+        print("There is no path from %d to %d" % (source, destination))
+    else:
+        path.insert(0, source)
+        print("Shortest Path is: ", path)
+
+
+if __name__ == "__main__":
+
+    # this is an undirected unweighted graph
+    g = AdjacencyMatrixGraph(9, directed=False)
+
+    # add the edges to the graph
+    g.add_edge(0, 1)
+    g.add_edge(1, 2)
+    g.add_edge(1, 3)
+    g.add_edge(2, 3)
+    g.add_edge(1, 4)
+    g.add_edge(3, 5)
+    g.add_edge(5, 4)
+    g.add_edge(3, 6)
+    g.add_edge(6, 6)
+    g.add_edge(0, 7)
+
+    shortest_path(g, 0, 5)
+    shortest_path(g, 0, 6)
+    shortest_path(g, 7, 4)
@@ -0,0 +1,149 @@
+import queue as q
+import numpy as np
+from . import instrumentation
+from .graph import AdjacencyMatrixGraph
+
+
+@instrumentation.timed("topological_sort")
+def topological_sort(graph):
+    queue = q.Queue()
+
+    in_degree_map = {}
+
+    for vertex in range(graph.num_vertices):
+        in_degree_map[vertex] = graph.get_in_degree(vertex)
+
+        # queues all nodes which have no dependencies i.e. no incoming edges
+        if in_degree_map[vertex] == 0:
+            queue.put(vertex)
+
+    top_sort_result = []
+
+    counters = instrumentation.active_counters
+
+    while not queue.empty():
+
+        next_vertex = queue.get()
+        top_sort_result.append(next_vertex)
+
+        dependent_vertices = graph.get_adjacent_vertices(next_vertex)
+
+        if counters is not None:
+            counters.vertices_settled += 1
+            counters.edges_relaxed += len(dependent_vertices)
+
+        for dependent_vertex in dependent_vertices:
+            in_degree_map[dependent_vertex] -= 1
+
+            if in_degree_map[dependent_vertex] == 0:
+                queue.put(dependent_vertex)
+
+    if len(top_sort_result) != graph.num_vertices:
+        raise ValueError("This graph has a cycle")
+
+    return top_sort_result
+
+
+@instrumentation.timed("topological_layers")
+def topological_layers(graph):
+    """
+    Kahn's algorithm taking a whole layer at a time. The first layer holds
+    the vertices with no incoming edges and every following layer the
+    vertices whose incoming edges all start in earlier layers. The vertices
+    of a layer do not depend on each other, so they can run at the same time.
+
+    :param graph: directed acyclic graph
+    :return: list holding a sorted array of the vertices of every layer
+    """
+    csr_graph = graph.to_csr()
+    in_degree = np.bincount(csr_graph.indices, minlength=graph.num_vertices)
+
+    layers = []
+    num_sorted = 0
+    layer = np.flatnonzero(in_degree == 0)
+
+    while len(layer) > 0:
+        layers.append(layer)
+        num_sorted += len(layer)
+
+        # remove the edges leaving the layer
+        _, dependent_vertices, _ = csr_graph.gather_edges(layer)
+
+        counters = instrumentation.active_counters
+        if counters is not None:
+            counters.vertices_settled += len(layer)
+            counters.edges_relaxed += len(dependent_vertices)
+        in_degree -= np.bincount(dependent_vertices, minlength=graph.num_vertices)
+
+        dependent_vertices = np.unique(dependent_vertices)
+        layer = dependent_vertices[in_degree[dependent_vertices] == 0]
+
+    if num_sorted != graph.num_vertices:
+        raise ValueError("This graph has a cycle")
+
+    return layers
+
+
+def critical_path(graph):
+    """
+    The longest path through a directed acyclic graph whose edge weights
+    are task durations. No schedule can finish sooner than the length of
+    this path, however many workers run the tasks.
+
+    :param graph: directed acyclic graph
+    :return: the length of the critical path and the list of its vertices
+    """
+    csr_graph = graph.to_csr()
+
+    # the length of the longest path ending at every vertex
+    finish = np.zeros(graph.num_vertices)
+    predecessors = np.full(graph.num_vertices, -1, dtype=np.int64)
+
+    # every edge into a layer starts in an earlier layer, so the longest
+    # paths to a layer are final before its own edges are followed
+    for layer in topological_layers(csr_graph):
+        src, dst, weights = csr_graph.gather_edges(layer)
+        candidates = finish[src] + weights
+
+        np.maximum.at(finish, dst, candidates)
+
+        longest = candidates == finish[dst]
+        predecessors[dst[longest]] = src[longest]
+
+    if graph.num_vertices == 0:
+        return 0.0, []
+
+    vertex = int(np.argmax(finish))
+    path = [vertex]
+
+    while predecessors[vertex] != -1:
+        vertex = int(predecessors[vertex])
+        path.append(vertex)
+
+    path.reverse()
+    return float(finish[path[-1]]), path
+
+
+if __name__ == "__main__":
+
+    # this is an undirected graph
+    directed_acyclic_graph = AdjacencyMatrixGraph(9, directed=True)
+
+    # add the edges to the graph
+    directed_acyclic_graph.add_edge(0, 1)
+    directed_acyclic_graph.add_edge(1, 2)
+    directed_acyclic_graph.add_edge(2, 7)
+    directed_acyclic_graph.add_edge(2, 4)
+    directed_acyclic_graph.add_edge(2, 3)
+    directed_acyclic_graph.add_edge(1, 5)
+    directed_acyclic_graph.add_edge(5, 6)
+    directed_acyclic_graph.add_edge(3, 6)
+    directed_acyclic_graph.add_edge(3, 4)
+    directed_acyclic_graph.add_edge(6, 8)
+
+    print(topological_sort(directed_acyclic_graph))
+
+    layers = topological_layers(directed_acyclic_graph)
+    print("Layers: ", [layer.tolist() for layer in layers])
+    print("Widest layer: ", max(len(layer) for layer in layers))
+    print("Critical path: ", critical_path(directed_acyclic_graph))
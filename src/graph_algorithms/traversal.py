@@ -0,0 +1,130 @@
+from collections import deque
+import numpy as np
+from . import instrumentation
+from .graph import AdjacencyMatrixGraph
+
+
+def iter_breadth_first(graph, start=0, records=False, explored=None):
+    """
+    Lazily yields the vertices reachable from the start vertex in breadth
+    first order, so the caller can stop early without the rest of the
+    traversal being computed.
+
+    :param graph: graph to traverse
+    :param start: vertex the traversal starts from
+    :param records: if True yields (vertex, depth, parent) tuples rather than
+                    vertices, the parent of the start vertex is None
+    :param explored: sequence of flags marking the vertices already explored,
+                     which are skipped and marked as they are visited. A
+                     fresh bytearray is used if omitted
+    :return: generator of the visited vertices
+    """
+    if explored is None:
+        explored = bytearray(graph.num_vertices)
+
+    if explored[start]:
+        return
+
+    # vertices are marked when they are queued so they are only queued once
+    explored[start] = 1
+    queue = deque([(start, 0, None)])
+
+    counters = instrumentation.active_counters
+
+    while queue:
+        vertex, depth, parent = queue.popleft()
+
+        yield (vertex, depth, parent) if records else vertex
+
+        neighbours = graph.get_adjacent_vertices(vertex)
+
+        if counters is not None:
+            counters.vertices_settled += 1
+            counters.edges_relaxed += len(neighbours)
+
+        for neighbour in neighbours:
+            if not explored[neighbour]:
+                explored[neighbour] = 1
+                queue.append((neighbour, depth + 1, vertex))
+
+
+def iter_depth_first(graph, start=0, records=False, explored=None):
+    """
+    Lazily yields the vertices reachable from the start vertex in depth
+    first order. An explicit stack is used instead of recursion so that
+    the depth of the graph is not limited by the recursion limit.
+
+    :param graph: graph to traverse
+    :param start: vertex the traversal starts from
+    :param records: if True yields (vertex, depth, parent) tuples rather than
+                    vertices, the parent of the start vertex is None
+    :param explored: sequence of flags marking the vertices already explored,
+                     which are skipped and marked as they are visited. A
+                     fresh bytearray is used if omitted
+    :return: generator of the visited vertices
+    """
+    if explored is None:
+        explored = bytearray(graph.num_vertices)
+
+    if explored[start]:
+        return
+
+    explored[start] = 1
+    yield (start, 0, None) if records else start
+
+    # every entry holds a vertex on the current path and an iterator over
+    # the neighbours of the vertex which are still to be tried
+    stack = [(start, iter(graph.get_adjacent_vertices(start)))]
+
+    while stack:
+        vertex, neighbours = stack[-1]
+
+        for child in neighbours:
+            if not explored[child]:
+                explored[child] = 1
+                yield (child, len(stack), vertex) if records else child
+
+                stack.append((child, iter(graph.get_adjacent_vertices(child))))
+                break
+        else:
+            # every neighbour has been explored, backtrack
+            stack.pop()
+
+
+def breadth_first_search(graph, start=0):
+
+    for vertex in iter_breadth_first(graph, start):
+        print("Visited: ", vertex)
+
+
+def depth_first_search(graph, explored, current=0):
+
+    for vertex in iter_depth_first(graph, current, explored=explored):
+        print("Visited: ", vertex)
+
+
+if __name__ == "__main__":
+
+    # this is an undirected graph
+    g = AdjacencyMatrixGraph(9)
+
+    # add the edges to the graph
+    g.add_edge(0, 1)
+    g.add_edge(1, 2)
+    g.add_edge(2, 7)
+    g.add_edge(2, 4)
+    g.add_edge(2, 3)
+    g.add_edge(1, 5)
+    g.add_edge(5, 6)
+    g.add_edge(6, 3)
+    g.add_edge(3, 4)
+    g.add_edge(6, 8)
+
+    print("Breadth First Traversal")
+    # perform breadth first search starting from node 2 on the graph
+    breadth_first_search(g, 2)
+
+    print("Depth First Traversal")
+    is_visited = np.zeros(g.num_vertices)
+    # perform depth first search starting from node 2 on the graph
+    depth_first_search(g, is_visited, 2)
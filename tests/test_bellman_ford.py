@@ -0,0 +1,152 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from graph_algorithms.bellman_ford import bellman_ford, johnson
+from graph_algorithms.dijkstra import single_source_dijkstra
+from graph_algorithms.floyd_warshall import floyd_warshall
+from graph_algorithms.graph import AdjacencyMatrixGraph, AdjacencySetGraph, CSRGraph
+
+BACKENDS = (AdjacencyMatrixGraph, AdjacencySetGraph, CSRGraph)
+
+
+def random_signed_graph(graph_class, num_vertices, num_edges, seed):
+    """
+    :return: directed graph with negative weights but no negative weight
+             cycle, as every weight is a positive weight shifted by the
+             difference of the potentials of its ends
+    """
+    rng = np.random.default_rng(seed)
+    potentials = rng.integers(-5, 6, size=num_vertices)
+
+    graph = graph_class(num_vertices, directed=True, signed_weights=True)
+
+    for _ in range(num_edges):
+        v1, v2 = rng.integers(num_vertices, size=2).tolist()
+        weight = int(rng.integers(1, 10)) + int(potentials[v1] - potentials[v2])
+
+        if v1 != v2 and weight != 0:
+            graph.add_edge(v1, v2, weight)
+
+    return graph
+
+
+def path_weight(graph, path):
+    return sum(graph.get_edge_weight(v1, v2) for v1, v2 in zip(path, path[1:]))
+
+
+class BellmanFordTest(unittest.TestCase):
+
+    def test_matches_floyd_warshall(self):
+        for graph_class in BACKENDS:
+            for seed in range(5):
+                with self.subTest(graph_class=graph_class.__name__, seed=seed):
+                    graph = random_signed_graph(graph_class, 12, 30, seed)
+                    expected, _ = floyd_warshall(graph)
+
+                    for source in range(graph.num_vertices):
+                        result = bellman_ford(graph, source)
+                        self.assertEqual(result.distances.tolist(), expected[source].tolist())
+
+                        for v in range(graph.num_vertices):
+                            path = result.path_to(v)
+                            if path is None:
+                                self.assertEqual(expected[source, v], np.inf)
+                            else:
+                                self.assertEqual(path_weight(graph, path), expected[source, v])
+
+    def test_negative_cycle_directed(self):
+        graph = CSRGraph(4, directed=True, signed_weights=True)
+        graph.add_edge(0, 1, 1)
+        graph.add_edge(1, 2, -3)
+        graph.add_edge(2, 1, 1)
+
+        with self.assertRaises(ValueError):
+            bellman_ford(graph, 0)
+        with self.assertRaises(ValueError):
+            johnson(graph)
+
+        # the cycle cannot be reached from 3
+        self.assertEqual(bellman_ford(graph, 3).num_settled, 1)
+
+    def test_negative_cycle_undirected(self):
+        for graph_class in BACKENDS:
+            with self.subTest(graph_class=graph_class.__name__):
+                graph = graph_class(3, directed=False, signed_weights=True)
+                graph.add_edge(0, 1, 2)
+                graph.add_edge(1, 2, -1)
+
+                with self.assertRaises(ValueError):
+                    bellman_ford(graph, 0)
+                with self.assertRaises(ValueError):
+                    johnson(graph)
+
+
+class JohnsonTest(unittest.TestCase):
+
+    def test_matches_floyd_warshall(self):
+        for graph_class in BACKENDS:
+            for seed in range(5):
+                with self.subTest(graph_class=graph_class.__name__, seed=seed):
+                    graph = random_signed_graph(graph_class, 12, 30, seed)
+                    expected, _ = floyd_warshall(graph)
+
+                    distances, predecessors = johnson(graph)
+                    np.testing.assert_allclose(distances, expected)
+
+                    # the paths end at the source of their row
+                    for source in range(graph.num_vertices):
+                        reached = np.isfinite(distances[source])
+                        self.assertTrue((predecessors[source][reached] >= 0).all())
+                        self.assertEqual(predecessors[source][source], source)
+
+    def test_selected_sources(self):
+        graph = random_signed_graph(CSRGraph, 8, 20, 0)
+        expected, _ = floyd_warshall(graph)
+
+        distances, _ = johnson(graph, sources=[5, 2])
+        np.testing.assert_allclose(distances, expected[[5, 2]])
+
+
+class SignedWeightsTest(unittest.TestCase):
+
+    def test_unsigned_graph_rejects_light_weights(self):
+        for graph_class in BACKENDS:
+            with self.subTest(graph_class=graph_class.__name__):
+                graph = graph_class(3)
+
+                for weight in (0, 0.5, -1):
+                    with self.assertRaises(ValueError):
+                        graph.add_edge(0, 1, weight)
+
+                with self.assertRaises(ValueError):
+                    graph.add_edges(np.array([0, 1]), np.array([1, 2]), np.array([2, 0.5]))
+
+    def test_signed_graph_rejects_zero_weights(self):
+        for graph_class in BACKENDS:
+            with self.subTest(graph_class=graph_class.__name__):
+                graph = graph_class(3, signed_weights=True)
+                graph.add_edge(0, 1, -0.5)
+
+                self.assertEqual(graph.get_edge_weight(1, 0), -0.5)
+
+                with self.assertRaises(ValueError):
+                    graph.add_edge(1, 2, 0)
+                with self.assertRaises(ValueError):
+                    graph.add_edges(np.array([0, 1]), np.array([2, 2]), np.array([-2, 0]))
+
+    def test_dijkstra_rejects_negative_weights(self):
+        graph = CSRGraph(3, directed=True, signed_weights=True)
+        graph.add_edge(0, 1, 2)
+        graph.add_edge(1, 2, -1)
+
+        with self.assertRaises(ValueError):
+            single_source_dijkstra(graph, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
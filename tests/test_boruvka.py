@@ -0,0 +1,54 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from graph_algorithms import boruvka, kruskal
+from graph_algorithms.graph import CSRGraph
+
+
+def random_graph(num_vertices, num_edges, seed):
+    rng = np.random.default_rng(seed)
+    graph = CSRGraph(num_vertices, directed=False)
+
+    # distinct weights make the minimum spanning forest unique
+    weights = rng.permutation(num_edges) + 1
+    for weight in weights.tolist():
+        v1, v2 = rng.integers(num_vertices, size=2).tolist()
+        if v1 != v2 and graph.get_edge_weight(v1, v2) == 0:
+            graph.add_edge(v1, v2, weight)
+
+    return graph
+
+
+def edge_sets(forest):
+    return [sorted(tuple(sorted(edge)) for edge in tree.tolist()) for tree in forest]
+
+
+class MinimumSpanningForestTest(unittest.TestCase):
+
+    def test_matches_kruskal(self):
+        for seed in range(3):
+            graph = random_graph(60, 90, seed)
+            expected = edge_sets(kruskal.minimum_spanning_forest(graph))
+
+            self.assertEqual(edge_sets(boruvka.minimum_spanning_forest(graph)), expected)
+
+    def test_workers_match_kruskal(self):
+        for seed in range(3):
+            graph = random_graph(60, 90, seed)
+            expected = edge_sets(kruskal.minimum_spanning_forest(graph))
+
+            forest = boruvka.minimum_spanning_forest(graph, processes=2, chunk_size=7)
+            self.assertEqual(edge_sets(forest), expected)
+
+    def test_workers_without_edges(self):
+        forest = boruvka.minimum_spanning_forest(CSRGraph(3, directed=False), processes=2)
+        self.assertEqual([len(tree) for tree in forest], [0, 0, 0])
+
+
+if __name__ == "__main__":
+    unittest.main()
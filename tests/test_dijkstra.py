@@ -0,0 +1,118 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from graph_algorithms.dijkstra import _max_integer_weight, build_distance_table, single_source_dijkstra
+from graph_algorithms.graph import AdjacencyMatrixGraph, AdjacencySetGraph, CSRGraph
+
+BACKENDS = (AdjacencyMatrixGraph, AdjacencySetGraph, CSRGraph)
+
+
+def build(graph_class, num_vertices, edges, directed=True):
+    graph = graph_class(num_vertices, directed=directed)
+    for v1, v2, weight in edges:
+        graph.add_edge(v1, v2, weight)
+
+    return graph
+
+
+class EarlyExitTest(unittest.TestCase):
+
+    # the direct edge to 2 is reached first but is not the shortest path
+    EDGES = [(0, 1, 1), (0, 2, 10), (1, 3, 1), (3, 2, 1)]
+
+    def test_unsettled_vertices_are_unknown(self):
+        for graph_class in BACKENDS:
+            with self.subTest(graph_class=graph_class.__name__):
+                result = single_source_dijkstra(build(graph_class, 4, self.EDGES), 0, destination=1)
+
+                self.assertEqual(result.path_to(1), [0, 1])
+                self.assertEqual(result.distance_to(1), 1)
+                self.assertFalse(result.is_final(2))
+
+                with self.assertRaises(ValueError):
+                    result.path_to(2)
+                with self.assertRaises(ValueError):
+                    result.distance_to(2)
+
+                self.assertEqual(result.distance_table()[2], (None, None))
+
+    def test_destination_found_late_is_final(self):
+        result = single_source_dijkstra(build(CSRGraph, 4, self.EDGES), 0, destination=2)
+
+        self.assertEqual(result.path_to(2), [0, 1, 3, 2])
+        self.assertEqual(result.distance_to(2), 3)
+
+    def test_destination_without_pushed_neighbours(self):
+        for graph_class in BACKENDS:
+            with self.subTest(graph_class=graph_class.__name__):
+                result = single_source_dijkstra(build(graph_class, 3, [(0, 1, 1), (1, 2, 1)]), 0, destination=1)
+
+                self.assertEqual(result.path_to(1), [0, 1])
+                self.assertFalse(result.is_final(2))
+
+                with self.assertRaises(ValueError):
+                    result.path_to(2)
+                with self.assertRaises(ValueError):
+                    result.distance_to(2)
+
+    def test_destination_is_the_source(self):
+        for graph_class in BACKENDS:
+            with self.subTest(graph_class=graph_class.__name__):
+                result = single_source_dijkstra(build(graph_class, 4, self.EDGES), 0, destination=0)
+
+                self.assertEqual(result.path_to(0), [0])
+                self.assertEqual(result.distance_to(0), 0)
+                self.assertEqual(result.num_settled, 1)
+
+                for v in (1, 2, 3):
+                    self.assertFalse(result.is_final(v))
+                    self.assertEqual(result.distance_table()[v], (None, None))
+
+    def test_full_search_reports_unreachable_vertices(self):
+        result = single_source_dijkstra(build(CSRGraph, 5, self.EDGES), 0)
+
+        self.assertIsNone(result.path_to(4))
+        self.assertEqual(result.distance_to(2), 3)
+
+
+class CSRViewTest(unittest.TestCase):
+
+    def test_view_is_reused_until_the_graph_changes(self):
+        for graph_class in (AdjacencyMatrixGraph, AdjacencySetGraph):
+            with self.subTest(graph_class=graph_class.__name__):
+                graph = build(graph_class, 4, [(0, 1, 1), (1, 2, 1)], directed=False)
+
+                view = graph.to_csr()
+                self.assertIs(graph.to_csr(), view)
+                self.assertTrue(view.read_only)
+
+                graph.add_edge(2, 3, 1)
+                self.assertIsNot(graph.to_csr(), view)
+                self.assertEqual(single_source_dijkstra(graph, 0, destination=3).path_to(3), [0, 1, 2, 3])
+
+
+class DialCheckTest(unittest.TestCase):
+
+    def test_weight_check_follows_changes(self):
+        for graph_class in BACKENDS:
+            with self.subTest(graph_class=graph_class.__name__):
+                graph = build(graph_class, 4, [(0, 1, 2), (1, 2, 3)])
+
+                self.assertEqual(_max_integer_weight(graph), 3)
+                self.assertEqual(build_distance_table(graph, 0)[2], (5, 1))
+
+                graph.add_edge(2, 3, 1.5)
+                self.assertIsNone(_max_integer_weight(graph))
+                self.assertEqual(build_distance_table(graph, 0)[3], (6.5, 2))
+
+                graph.remove_edge(2, 3)
+                graph.add_edge(0, 2, 4)
+                self.assertEqual(_max_integer_weight(graph), 4)
+                self.assertEqual(build_distance_table(graph, 0)[2], (4, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from graph_algorithms.disjoint_set import DisjointSet
+
+
+class DisjointSetTest(unittest.TestCase):
+
+    def test_labels(self):
+        forest = DisjointSet(5)
+        forest.union(0, 1)
+        forest.union(3, 1)
+        self.assertFalse(forest.union(0, 3))
+
+        labels = forest.labels()
+        self.assertEqual(len(set(labels[[0, 1, 3]].tolist())), 1)
+        self.assertEqual(len(set(labels.tolist())), forest.num_sets)
+
+    def test_changing_labels_leaves_the_sets_alone(self):
+        forest = DisjointSet(4)
+        forest.union(0, 1)
+
+        labels = forest.labels()
+        labels[:] = 3
+
+        self.assertNotEqual(forest.find(0), forest.find(2))
+        self.assertEqual(forest.find(0), forest.find(1))
+        self.assertTrue(forest.union(2, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from graph_algorithms.dijkstra import single_source_dijkstra
+from graph_algorithms.dynamic_shortest_path import DynamicShortestPaths
+from graph_algorithms.graph import AdjacencySetGraph, CSRGraph
+
+
+class DynamicShortestPathsTest(unittest.TestCase):
+
+    def build(self):
+        graph = AdjacencySetGraph(3, directed=True)
+        graph.add_edge(0, 2, 2)
+        graph.add_edge(2, 1, 2)
+
+        return graph
+
+    def assertMatchesSearch(self, paths):
+        expected = single_source_dijkstra(paths.graph, paths.source).distances
+        self.assertEqual(paths.distances.tolist(), expected.tolist())
+
+    def test_edge_made_heavier_later_in_the_batch(self):
+        paths = DynamicShortestPaths(self.build(), 0)
+        paths.update([(0, 1, 1), (0, 1, 5)])
+
+        self.assertEqual(paths.distances[1], 4)
+        self.assertEqual(paths.result().path_to(1), [0, 2, 1])
+
+    def test_edge_removed_later_in_the_batch(self):
+        paths = DynamicShortestPaths(self.build(), 0)
+        paths.update([(0, 1, 1), (0, 1, None)])
+
+        self.assertEqual(paths.distances[1], 4)
+        self.assertEqual(paths.result().path_to(1), [0, 2, 1])
+
+    def test_failed_batch_is_undone(self):
+        for graph_class in (AdjacencySetGraph, CSRGraph):
+            graph = graph_class(3, directed=True)
+            graph.add_edge(0, 2, 2)
+            graph.add_edge(2, 1, 2)
+
+            paths = DynamicShortestPaths(graph, 0)
+            edges = [array.tolist() for array in graph.edges()]
+
+            for failing in ((1, 2, -1), (1, 0, None), (0, 7, 1)):
+                with self.assertRaises(ValueError):
+                    paths.update([(0, 1, 1), (2, 1, 5), (0, 2, None), failing])
+
+                self.assertEqual([array.tolist() for array in graph.edges()], edges)
+                self.assertEqual(paths.distances.tolist(), [0, 4, 2])
+
+            # the maintainer is still in step with the graph
+            paths.update([(0, 2, None), (1, 2, 1), (0, 1, 3)])
+            self.assertMatchesSearch(paths)
+            self.assertEqual(paths.result().path_to(2), [0, 1, 2])
+
+            paths.update([(0, 1, None)])
+            self.assertEqual(paths.distances.tolist(), [0, np.inf, np.inf])
+
+    def test_random_batches_match_a_new_search(self):
+        rng = np.random.default_rng(0)
+
+        for graph_class in (AdjacencySetGraph, CSRGraph):
+            for directed in (True, False):
+                graph = graph_class(12, directed=directed)
+                for _ in range(30):
+                    v1, v2 = rng.integers(12, size=2).tolist()
+                    if v1 != v2:
+                        graph.add_edge(v1, v2, int(rng.integers(1, 10)))
+
+                paths = DynamicShortestPaths(graph, 0)
+
+                for _ in range(20):
+                    # an edge may change several times in a batch, but is only
+                    # removed while it is known to exist
+                    batch = []
+                    touched = set()
+                    for _ in range(4):
+                        v1, v2 = rng.integers(12, size=2).tolist()
+                        if v1 == v2:
+                            continue
+
+                        key = (v1, v2) if directed else (min(v1, v2), max(v1, v2))
+                        if key not in touched and graph.get_edge_weight(v1, v2) != 0 and rng.random() < 0.3:
+                            batch.append((v1, v2, None))
+                        else:
+                            batch.append((v1, v2, int(rng.integers(1, 10))))
+                        touched.add(key)
+
+                    paths.update(batch)
+                    self.assertMatchesSearch(paths)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from graph_algorithms.dynamic_topological_sort import DynamicTopologicalOrder
+from graph_algorithms.graph import AdjacencyMatrixGraph, AdjacencySetGraph, CSRGraph
+
+
+def reaches(edges, start, target):
+    """
+    :return: True if target can be reached from start along the edges
+    """
+    seen = {start}
+    stack = [start]
+
+    while stack:
+        vertex = stack.pop()
+        if vertex == target:
+            return True
+
+        for v1, v2 in edges:
+            if v1 == vertex and v2 not in seen:
+                seen.add(v2)
+                stack.append(v2)
+
+    return False
+
+
+class DynamicTopologicalOrderTest(unittest.TestCase):
+
+    def assertValidOrder(self, order, edges):
+        vertices = order.order()
+
+        self.assertEqual(sorted(vertices), list(range(order.num_vertices)))
+        for position, v in enumerate(vertices):
+            self.assertEqual(order.position(v), position)
+
+        for v1, v2 in edges:
+            self.assertTrue(order.precedes(v1, v2), (v1, v2))
+
+    def test_random_changes_keep_the_order_valid(self):
+        rng = np.random.default_rng(0)
+
+        for _ in range(5):
+            order = DynamicTopologicalOrder(15)
+            edges = set()
+
+            for _ in range(200):
+                v1, v2 = rng.integers(15, size=2).tolist()
+
+                if (v1, v2) in edges and rng.random() < 0.5:
+                    order.remove_edge(v1, v2)
+                    edges.remove((v1, v2))
+                elif v1 == v2 or reaches(edges, v2, v1):
+                    before = order.order()
+
+                    with self.assertRaises(ValueError):
+                        order.add_edge(v1, v2)
+
+                    self.assertEqual(order.order(), before)
+                else:
+                    order.add_edge(v1, v2)
+                    edges.add((v1, v2))
+
+                self.assertValidOrder(order, edges)
+
+    def test_cycle_is_rejected(self):
+        order = DynamicTopologicalOrder(4)
+        order.add_edge(0, 1)
+        order.add_edge(1, 2)
+        order.add_edge(2, 3)
+
+        before = order.order()
+
+        with self.assertRaises(ValueError):
+            order.add_edge(3, 0)
+        with self.assertRaises(ValueError):
+            order.add_edge(2, 2)
+
+        self.assertEqual(order.order(), before)
+
+        # the rejected edge was not added, so removing it fails
+        with self.assertRaises(ValueError):
+            order.remove_edge(3, 0)
+
+        order.remove_edge(1, 2)
+        order.add_edge(3, 0)
+        self.assertValidOrder(order, [(0, 1), (2, 3), (3, 0)])
+
+    def test_from_graph(self):
+        edges = [(5, 2), (5, 0), (4, 0), (4, 1), (2, 3), (3, 1)]
+
+        for graph_class in (AdjacencyMatrixGraph, AdjacencySetGraph, CSRGraph):
+            with self.subTest(graph_class=graph_class.__name__):
+                graph = graph_class(6, directed=True)
+                for v1, v2 in edges:
+                    graph.add_edge(v1, v2, 1)
+
+                order = DynamicTopologicalOrder.from_graph(graph)
+                self.assertValidOrder(order, edges)
+
+                with self.assertRaises(ValueError):
+                    order.add_edge(1, 5)
+
+                order.add_edge(1, 0)
+                self.assertValidOrder(order, edges + [(1, 0)])
+
+
+if __name__ == "__main__":
+    unittest.main()
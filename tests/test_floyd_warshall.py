@@ -0,0 +1,38 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from graph_algorithms.floyd_warshall import floyd_warshall, floyd_warshall_path
+from graph_algorithms.graph import AdjacencyMatrixGraph, CSRGraph
+
+
+class FloydWarshallTest(unittest.TestCase):
+
+    def build(self, graph_class):
+        graph = graph_class(5, directed=True)
+        graph.add_edge(0, 1, 2)
+        graph.add_edge(1, 2, 3)
+        graph.add_edge(0, 2, 7)
+        graph.add_edge(2, 3, 1)
+
+        return graph
+
+    def test_backends_and_dtypes_agree(self):
+        for graph_class in (AdjacencyMatrixGraph, CSRGraph):
+            for dtype in (np.float64, np.float32):
+                for block_size in (None, 2):
+                    distances, predecessors = floyd_warshall(self.build(graph_class), dtype, block_size)
+
+                    self.assertEqual(distances.dtype, dtype)
+                    self.assertEqual(predecessors.dtype, np.int32)
+                    self.assertEqual(distances[0].tolist(), [0, 2, 5, 6, np.inf])
+                    self.assertEqual(floyd_warshall_path(predecessors, 0, 3), [0, 1, 2, 3])
+                    self.assertEqual(predecessors[0, 4], -1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from graph_algorithms.dijkstra import bidirectional_dijkstra
+from graph_algorithms.graph import AdjacencySetGraph, CSRGraph, Graph
+
+
+class ReverseTest(unittest.TestCase):
+
+    def test_reverse_is_reused_until_the_graph_changes(self):
+        graph = CSRGraph(4, directed=True)
+        graph.add_edge(0, 1, 1)
+        graph.add_edge(1, 2, 2)
+
+        reverse = graph.reverse()
+        self.assertIs(graph.reverse(), reverse)
+        self.assertTrue(reverse.read_only)
+        self.assertEqual(list(reverse.get_adjacent_vertices(2)), [1])
+
+        graph.add_edge(3, 2, 1)
+        self.assertIsNot(graph.reverse(), reverse)
+        self.assertEqual(list(graph.reverse().get_adjacent_vertices(2)), [1, 3])
+        self.assertEqual(bidirectional_dijkstra(graph, 3, 2).path, [3, 2])
+
+    def test_undirected_graph_is_its_own_reverse(self):
+        graph = CSRGraph(2)
+        graph.add_edge(0, 1)
+
+        self.assertIs(graph.reverse(), graph)
+
+
+class AdjacencySetTest(unittest.TestCase):
+
+    def test_adjacency_cannot_be_changed_by_callers(self):
+        graph = AdjacencySetGraph(3, directed=True)
+        graph.add_edge(0, 1, 2)
+        graph.add_edge(0, 2, 3)
+
+        adjacent = graph.get_adjacent_vertices(0)
+        with self.assertRaises((TypeError, AttributeError)):
+            adjacent[0] = 2
+        with self.assertRaises(AttributeError):
+            adjacent.append(2)
+
+        # the arrays are built for the caller, so changing them is harmless
+        neighbours, weights = graph.neighbors_with_weights(0)
+        neighbours[0] = 2
+        weights[0] = 5
+
+        self.assertEqual(list(graph.get_adjacent_vertices(0)), [1, 2])
+        self.assertEqual(graph.get_edge_weight(0, 1), 2)
+
+    def test_adjacency_follows_changes(self):
+        graph = AdjacencySetGraph(3, directed=False)
+        graph.add_edge(0, 2, 1)
+
+        adjacent = graph.get_adjacent_vertices(0)
+        graph.add_edge(0, 1, 4)
+
+        self.assertEqual(list(adjacent), [2])
+        self.assertEqual(list(graph.get_adjacent_vertices(0)), [1, 2])
+        self.assertEqual(graph.neighbors_with_weights(0)[1].tolist(), [4, 1])
+
+
+class EdgeListTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write(self, text):
+        path = os.path.join(self.directory, "edges.txt")
+        with open(path, "w") as edge_file:
+            edge_file.write(text)
+
+        return path
+
+    def test_graph_reads_a_csr_graph(self):
+        path = self.write("# roads\n0,1,2\n\n1,2,3\n")
+
+        for chunk_size in (1, 100):
+            graph = Graph.from_edge_list(path, chunk_size=chunk_size)
+
+            self.assertIsInstance(graph, CSRGraph)
+            self.assertEqual(graph.get_edge_weight(2, 1), 3)
+
+        self.assertIsInstance(AdjacencySetGraph.from_edge_list(path), AdjacencySetGraph)
+
+    def test_lines_without_weights(self):
+        graph = Graph.from_edge_list(self.write("0 1\n1 2\n"), directed=True)
+        self.assertEqual(graph.edges()[2].tolist(), [1, 1])
+
+    def test_mixed_columns_are_rejected(self):
+        path = self.write("0 1\n1 2 3\n")
+
+        for chunk_size in (1, 100):
+            with self.assertRaisesRegex(ValueError, "as many columns as the first edge"):
+                Graph.from_edge_list(path, chunk_size=chunk_size)
+
+
+if __name__ == "__main__":
+    unittest.main()
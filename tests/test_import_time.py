@@ -0,0 +1,87 @@
+import os
+import subprocess
+import sys
+import unittest
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+# wall clock budgets for a cold import in a fresh interpreter, the best of
+# a few runs is compared so that a single slow start does not fail the test
+PACKAGE_BUDGET_SECONDS = 0.1
+SUBMODULE_BUDGET_SECONDS = 0.5
+RUNS = 3
+
+TIMING_SCRIPT = """
+import sys
+import time
+
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+
+print(elapsed)
+print("numpy" in sys.modules)
+print(sorted(name for name in sys.modules if name.startswith("graph_algorithms.")))
+"""
+
+
+def run_python(script):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [SRC_DIR, env.get("PYTHONPATH")]))
+
+    return subprocess.run([sys.executable, "-c", script], env=env, check=True,
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True).stdout
+
+
+def time_import(module):
+    """
+    :return: the fastest import time in seconds, whether NumPy was loaded
+             and the list of submodules loaded
+    """
+    results = []
+    for _ in range(RUNS):
+        elapsed, numpy_loaded, submodules = run_python(TIMING_SCRIPT.format(module=module)).splitlines()
+        results.append((float(elapsed), numpy_loaded == "True", submodules))
+
+    return min(results)
+
+
+class ImportTimeTest(unittest.TestCase):
+
+    def test_package_import_is_lazy(self):
+        elapsed, numpy_loaded, submodules = time_import("graph_algorithms")
+
+        self.assertFalse(numpy_loaded)
+        self.assertEqual(submodules, "[]")
+        self.assertLess(elapsed, PACKAGE_BUDGET_SECONDS)
+
+    def test_submodule_import_within_budget(self):
+        for module in ("graph_algorithms.graph", "graph_algorithms.dijkstra"):
+            with self.subTest(module=module):
+                elapsed, _, _ = time_import(module)
+                self.assertLess(elapsed, SUBMODULE_BUDGET_SECONDS)
+
+    def test_imports_print_nothing(self):
+        script = "import graph_algorithms, importlib\n" \
+                 "for name in graph_algorithms.SUBMODULES:\n" \
+                 "    importlib.import_module('graph_algorithms.' + name)\n"
+
+        self.assertEqual(run_python(script), "")
+
+    def test_no_star_imports(self):
+        package_dir = os.path.join(SRC_DIR, "graph_algorithms")
+
+        for name in sorted(os.listdir(package_dir)):
+            if name.endswith(".py"):
+                with open(os.path.join(package_dir, name)) as module_file:
+                    self.assertNotIn("import *", module_file.read(), name)
+
+    def test_lazy_attributes(self):
+        script = "import graph_algorithms\n" \
+                 "print(graph_algorithms.CSRGraph is graph_algorithms.graph.CSRGraph)\n"
+
+        self.assertEqual(run_python(script).strip(), "True")
+
+
+if __name__ == "__main__":
+    unittest.main()